@@ -17,17 +17,118 @@
 """Jira client wrapper for MCP server."""
 
 import asyncio
+import json
 import logging
-from typing import Any, Dict, List, Optional, cast
+import time
+from collections import OrderedDict
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    Generic,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+    cast,
+)
 
 from asyncio_throttle import Throttler
 from jira import JIRA
 from jira.exceptions import JIRAError
+from requests.adapters import HTTPAdapter
 
 from .config import JiraConfig
 
 logger = logging.getLogger(__name__)
 
+# Keep-alive connections held for Jira. Calls run concurrently in the default
+# executor, so the pool needs more than requests' default of 10 to avoid
+# discarding connections (and redoing TLS handshakes) under load.
+HTTP_POOL_SIZE = 20
+
+# Jira fields read by _issue_to_dict. Searches request only these so Jira
+# doesn't serialize (and we don't parse) every custom field on every issue.
+ISSUE_FIELDS = ",".join(
+    (
+        "summary",
+        "description",
+        "status",
+        "priority",
+        "issuetype",
+        "project",
+        "assignee",
+        "reporter",
+        "created",
+        "updated",
+        "resolution",
+        "labels",
+        "components",
+        "comment",
+        "fixVersions",
+        "customfield_10855",  # Target Version
+        "customfield_10464",  # Activity Type
+        "security",
+        "duedate",
+        "customfield_10022",  # Target Start
+        "customfield_10023",  # Target End
+        "timeoriginalestimate",
+        "customfield_10028",  # Story Points
+        "customfield_10583",  # Git Commit
+        "customfield_10875",  # Git Pull Requests
+        "subtasks",
+        "parent",
+    )
+)
+
+# get_issue/get_watchers results are reused for this many seconds, which
+# absorbs the repeated reads of one issue an agent makes while working on it.
+# Writes made through this client drop the cached copy straight away.
+ISSUE_CACHE_TTL = 30.0
+ISSUE_CACHE_SIZE = 512
+WATCHERS_CACHE_TTL = 30.0
+WATCHERS_CACHE_SIZE = 1024
+
+# Maximum watcher additions in flight at once when adding a whole team
+WATCHER_CONCURRENCY = 8
+
+# Seconds without a request after which keep_alive pings Jira, so an idle
+# pooled connection is reused rather than dropped by the server
+KEEPALIVE_INTERVAL = 25.0
+
+_T = TypeVar("_T")
+
+
+class _TTLCache(Generic[_T]):
+    """LRU cache whose entries expire ``ttl`` seconds after being stored.
+
+    Keys are Jira issue keys, which Jira matches case-insensitively.
+    """
+
+    def __init__(self, ttl: float, maxsize: int):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        # key -> (stored at, value), least recently used first
+        self._entries: OrderedDict[str, Tuple[float, _T]] = OrderedDict()
+
+    def get(self, key: str) -> Optional[_T]:
+        key = key.upper()
+        entry = self._entries.get(key)
+        if entry is None or time.monotonic() - entry[0] >= self.ttl:
+            return None
+        self._entries.move_to_end(key)
+        return entry[1]
+
+    def put(self, key: str, value: _T) -> None:
+        key = key.upper()
+        self._entries[key] = (time.monotonic(), value)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def pop(self, key: str) -> None:
+        self._entries.pop(key.upper(), None)
+
 
 class JiraClient:
     """Async wrapper for Jira client with rate limiting."""
@@ -37,6 +138,13 @@ class JiraClient:
         self.config = config
         self._jira: Optional[JIRA] = None
         self.throttler = Throttler(rate_limit=10, period=1.0)  # 10 requests per second
+        self._issue_cache: _TTLCache[Dict[str, Any]] = _TTLCache(
+            ISSUE_CACHE_TTL, ISSUE_CACHE_SIZE
+        )
+        self._watchers_cache: _TTLCache[List[Dict[str, Any]]] = _TTLCache(
+            WATCHERS_CACHE_TTL, WATCHERS_CACHE_SIZE
+        )
+        self._last_request = time.monotonic()
 
     async def connect(self) -> None:
         """Connect to Jira Cloud using basic auth with email and API token."""
@@ -54,13 +162,52 @@ class JiraClient:
                 options=options,
             )
 
+            # Every tool call shares this session's connection pool
+            adapter = HTTPAdapter(
+                pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE
+            )
+            self._jira._session.mount("https://", adapter)
+            self._jira._session.mount("http://", adapter)
+
             # Test connection
             await self._async_call(lambda: self._jira.myself())
         except JIRAError as e:
             raise ConnectionError(f"Failed to connect to Jira: {e}")
 
+    @property
+    def connected(self) -> bool:
+        """Whether connect() has succeeded since the last close()."""
+        return self._jira is not None
+
+    async def close(self) -> None:
+        """Close the Jira session and its pooled connections."""
+        if self._jira:
+            self._jira.close()
+            self._jira = None
+
+    async def keep_alive(self) -> None:
+        """Ping Jira whenever the session has been idle for KEEPALIVE_INTERVAL.
+
+        Keeps a pooled connection open so the next tool call skips the TCP and
+        TLS handshake. Runs until cancelled; failed pings are only logged.
+        """
+        while True:
+            idle = time.monotonic() - self._last_request
+            if idle < KEEPALIVE_INTERVAL:
+                await asyncio.sleep(KEEPALIVE_INTERVAL - idle)
+                continue
+            if self._jira is None:
+                await asyncio.sleep(KEEPALIVE_INTERVAL)
+                continue
+            try:
+                await self._async_call(lambda: self._jira.server_info())
+            except Exception as e:
+                logger.debug("Keep-alive request failed: %s", e)
+                self._last_request = time.monotonic()
+
     async def _async_call(self, func: Any) -> Any:
         """Execute synchronous Jira calls asynchronously with throttling."""
+        self._last_request = time.monotonic()
         async with self.throttler:
             loop = asyncio.get_running_loop()
             return await loop.run_in_executor(None, func)
@@ -69,38 +216,92 @@ class JiraClient:
         self, jql: str, max_results: Optional[int] = None
     ) -> List[Dict[str, Any]]:
         """Search for issues using JQL."""
+        return [
+            issue
+            async for page in self.search_issue_pages(jql, max_results)
+            for issue in page
+        ]
+
+    async def search_issue_pages(
+        self, jql: str, max_results: Optional[int] = None
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Search for issues using JQL, yielding each page as it arrives.
+
+        Jira Cloud caps the page size, so pages are requested by
+        nextPageToken until max_results issues have been yielded. Each page
+        needs the previous page's token, so pages can't be fetched in parallel.
+        Jira Server/Data Center has no token search and is paged by startAt
+        offset instead. A max_results below 1 yields nothing.
+        """
         if not self._jira:
             raise RuntimeError("Not connected to Jira")
 
         if max_results is None:
             max_results = self.config.max_results
 
-        try:
-            issues = await self._async_call(
-                lambda: self._jira.search_issues(
-                    jql, maxResults=max_results, expand="changelog"
+        jira = self._jira
+        is_cloud = jira._is_cloud
+        remaining = max_results
+        offset = 0
+        token: Optional[str] = None
+
+        def fetch_page() -> Tuple[List[Dict[str, Any]], Optional[str], bool]:
+            """Fetch the next page, its page token and whether more follow."""
+            if is_cloud:
+                page = jira.enhanced_search_issues(
+                    jql, nextPageToken=token, maxResults=remaining, fields=ISSUE_FIELDS
                 )
-            )
+            else:
+                page = jira.search_issues(
+                    jql, startAt=offset, maxResults=remaining, fields=ISSUE_FIELDS
+                )
+            # Convert in the worker thread so large pages don't block the loop
+            issues = [self._issue_to_dict(issue) for issue in page]
+            if is_cloud:
+                return issues, page.nextPageToken, page.nextPageToken is not None
+            return issues, None, offset + len(issues) < (page.total or 0)
 
-            return [self._issue_to_dict(issue) for issue in issues]
-        except JIRAError as e:
-            raise ValueError(f"JQL search failed: {e}")
+        while remaining > 0:
+            try:
+                issues, token, more = await self._async_call(fetch_page)
+            except JIRAError as e:
+                raise ValueError(f"JQL search failed: {e}")
+            if issues:
+                yield issues
+            remaining -= len(issues)
+            offset += len(issues)
+            if not issues or not more:
+                break
 
     async def get_issue(self, issue_key: str) -> Dict[str, Any]:
-        """Get a specific issue by key."""
+        """Get a specific issue by key.
+
+        A copy fetched within the last ISSUE_CACHE_TTL seconds is reused.
+        """
         if not self._jira:
             raise RuntimeError("Not connected to Jira")
 
+        cached = self._issue_cache.get(issue_key)
+        if cached is not None:
+            return cached
+
         try:
             issue = await self._async_call(
                 lambda: self._jira.issue(
                     issue_key, expand="changelog,transitions,comments"
                 )
             )
-            return self._issue_to_dict(issue)
         except JIRAError as e:
             raise ValueError(f"Failed to get issue {issue_key}: {e}")
 
+        result = self._issue_to_dict(issue)
+        self._issue_cache.put(issue_key, result)
+        return result
+
+    def _invalidate_issue(self, issue_key: str) -> None:
+        """Drop the cached copy of an issue after changing it."""
+        self._issue_cache.pop(issue_key)
+
     async def create_issue(
         self,
         project_key: str,
@@ -138,6 +339,9 @@ class JiraClient:
             issue = await self._async_call(
                 lambda: self._jira.create_issue(fields=issue_dict)
             )
+            if "parent" in fields:
+                # The parent's cached subtasks no longer include the new issue
+                self._invalidate_issue(fields["parent"]["key"])
             return self._issue_to_dict(issue)
         except JIRAError as e:
             raise ValueError(f"Failed to create issue: {e}")
@@ -160,9 +364,15 @@ class JiraClient:
                         seconds // 60
                     )  # Jira expects minutes as string
 
+        # PUT the fields directly: Issue.update needs the issue fetched first
+        # and reloads it afterwards, both redundant with get_issue below
+        url = f"{self._jira._options['server']}/rest/api/2/issue/{issue_key}"
+        payload = json.dumps({"fields": fields})
+        session = self._jira._session
+
         try:
-            issue = await self._async_call(lambda: self._jira.issue(issue_key))
-            await self._async_call(lambda: issue.update(fields=fields))
+            await self._async_call(lambda: session.put(url, data=payload))
+            self._invalidate_issue(issue_key)
             # Return updated issue
             return await self.get_issue(issue_key)
         except JIRAError as e:
@@ -193,6 +403,7 @@ class JiraClient:
             await self._async_call(
                 lambda: self._jira.transition_issue(issue, transition_id)
             )
+            self._invalidate_issue(issue_key)
 
             return await self.get_issue(issue_key)
         except JIRAError as e:
@@ -220,6 +431,7 @@ class JiraClient:
             comment_obj = await self._async_call(
                 lambda: self._jira.add_comment(issue, comment, **comment_kwargs)
             )
+            self._invalidate_issue(issue_key)
 
             return {
                 "id": comment_obj.id,
@@ -256,6 +468,7 @@ class JiraClient:
             work_log_obj = await self._async_call(
                 lambda: self._jira.add_worklog(issue, **work_log_params)
             )
+            self._invalidate_issue(issue_key)
 
             return {
                 "id": work_log_obj.id,
@@ -377,23 +590,41 @@ class JiraClient:
                         "value": security_level,
                     }
 
-            # Create the issue link
-            await self._async_call(
-                lambda: self._jira.create_issue_link(
-                    type=link_type,
-                    inwardIssue=inward_issue,
-                    outwardIssue=outward_issue,
-                    comment=comment_data,
-                )
-            )
-
-            # Get link types to find the proper names
+            # Get link types to find the proper names. JIRA.create_issue_link
+            # would fetch them again itself, so the link is POSTed directly.
             link_types = await self._async_call(lambda: self._jira.issue_link_types())
             link_type_info = None
+            inward_key, outward_key = inward_issue, outward_issue
             for lt in link_types:
                 if lt.name.lower() == link_type.lower():
                     link_type_info = lt
                     break
+            else:
+                # Like JIRA.create_issue_link, accept a link phrase instead of
+                # the name, swapping the issues for an inward phrase
+                for lt in link_types:
+                    if link_type in (lt.outward, lt.inward):
+                        link_type_info = lt
+                        if link_type == lt.inward:
+                            inward_key, outward_key = outward_issue, inward_issue
+                        break
+
+            # Create the issue link; the comment is added by the same request
+            payload = json.dumps(
+                {
+                    "type": {
+                        "name": link_type_info.name if link_type_info else link_type
+                    },
+                    "inwardIssue": {"key": inward_key},
+                    "outwardIssue": {"key": outward_key},
+                    "comment": comment_data,
+                }
+            )
+            url = f"{self._jira._options['server']}/rest/api/2/issueLink"
+            session = self._jira._session
+            await self._async_call(lambda: session.post(url, data=payload))
+            self._invalidate_issue(inward_issue)
+            self._invalidate_issue(outward_issue)
 
             return {
                 "link_type": link_type,
@@ -604,8 +835,10 @@ class JiraClient:
             raise RuntimeError("Not connected to Jira")
 
         try:
-            issue = await self._async_call(lambda: self._jira.issue(issue_key))
-            await self._async_call(lambda: self._jira.add_watcher(issue, username))
+            # add_watcher only needs the key; fetching the issue first would
+            # double the round trips when a whole team is added
+            await self._async_call(lambda: self._jira.add_watcher(issue_key, username))
+            self._watchers_cache.pop(issue_key)
 
             return {"issue_key": issue_key, "watcher": username, "added": True}
         except JIRAError as e:
@@ -625,8 +858,10 @@ class JiraClient:
             raise RuntimeError("Not connected to Jira")
 
         try:
-            issue = await self._async_call(lambda: self._jira.issue(issue_key))
-            await self._async_call(lambda: self._jira.remove_watcher(issue, username))
+            await self._async_call(
+                lambda: self._jira.remove_watcher(issue_key, username)
+            )
+            self._watchers_cache.pop(issue_key)
 
             return {"issue_key": issue_key, "watcher": username, "removed": True}
         except JIRAError as e:
@@ -646,23 +881,29 @@ class JiraClient:
         if not self._jira:
             raise RuntimeError("Not connected to Jira")
 
+        cached = self._watchers_cache.get(issue_key)
+        if cached is not None:
+            return cached
+
         try:
             watchers_obj = await self._async_call(
                 lambda: self._jira.watchers(issue_key)
             )
-
-            return [
-                {
-                    "username": watcher.name,
-                    "display_name": watcher.displayName,
-                    "email": getattr(watcher, "emailAddress", None),
-                    "active": getattr(watcher, "active", True),
-                }
-                for watcher in watchers_obj.watchers
-            ]
         except JIRAError as e:
             raise ValueError(f"Failed to get watchers for {issue_key}: {e}")
 
+        watchers = [
+            {
+                "username": watcher.name,
+                "display_name": watcher.displayName,
+                "email": getattr(watcher, "emailAddress", None),
+                "active": getattr(watcher, "active", True),
+            }
+            for watcher in watchers_obj.watchers
+        ]
+        self._watchers_cache.put(issue_key, watchers)
+        return watchers
+
     async def add_team_as_watchers(
         self, issue_key: str, team_members: List[str]
     ) -> Dict[str, Any]:
@@ -678,15 +919,23 @@ class JiraClient:
         if not self._jira:
             raise RuntimeError("Not connected to Jira")
 
-        successes = []
-        failures = []
+        semaphore = asyncio.Semaphore(WATCHER_CONCURRENCY)
 
-        for username in team_members:
-            try:
+        async def add_one(username: str) -> None:
+            async with semaphore:
                 await self.add_watcher(issue_key, username)
+
+        results = await asyncio.gather(
+            *(add_one(username) for username in team_members), return_exceptions=True
+        )
+
+        successes = []
+        failures = []
+        for username, result in zip(team_members, results):
+            if isinstance(result, BaseException):
+                failures.append({"username": username, "error": str(result)})
+            else:
                 successes.append(username)
-            except Exception as e:
-                failures.append({"username": username, "error": str(e)})
 
         return {
             "issue_key": issue_key,
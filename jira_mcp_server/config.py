@@ -16,9 +16,10 @@
 
 """Configuration management for Jira MCP Server."""
 
+import functools
 import json
 import os
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
 
 from dotenv import load_dotenv
 from pydantic import BaseModel, Field
@@ -26,6 +27,19 @@ from pydantic import BaseModel, Field
 load_dotenv()
 
 
+@functools.lru_cache(maxsize=8)
+def _parse_json_env(raw: str) -> Any:
+    """Decode a JSON environment value, or return an empty dict if it is invalid.
+
+    Cached by the raw string, so each distinct value is only decoded once.
+    Callers must not mutate the result; JiraConfig copies it on validation.
+    """
+    try:
+        return json.loads(raw)
+    except json.JSONDecodeError:
+        return {}
+
+
 class JiraConfig(BaseModel):
     """Configuration for Jira connection."""
 
@@ -58,22 +72,6 @@ class JiraConfig(BaseModel):
         Component aliases can be configured via JIRA_COMPONENT_ALIASES environment variable as JSON:
         JIRA_COMPONENT_ALIASES='{"ui": "User Interface", "be": "Backend Services", "infra": "Infrastructure"}'
         """
-        teams_json = os.getenv("JIRA_TEAMS", "{}")
-        teams = {}
-        try:
-            teams = json.loads(teams_json)
-        except json.JSONDecodeError:
-            # If teams JSON is invalid, just use empty dict
-            pass
-
-        component_aliases_json = os.getenv("JIRA_COMPONENT_ALIASES", "{}")
-        component_aliases = {}
-        try:
-            component_aliases = json.loads(component_aliases_json)
-        except json.JSONDecodeError:
-            # If component aliases JSON is invalid, just use empty dict
-            pass
-
         return cls(
             server_url=os.getenv("JIRA_SERVER_URL", ""),
             access_token=os.getenv("JIRA_ACCESS_TOKEN", ""),
@@ -81,8 +79,11 @@ class JiraConfig(BaseModel):
             verify_ssl=os.getenv("JIRA_VERIFY_SSL", "true").lower() == "true",
             timeout=int(os.getenv("JIRA_TIMEOUT", "30")),
             max_results=int(os.getenv("JIRA_MAX_RESULTS", "100")),
-            teams=teams,
-            component_aliases=component_aliases,
+            # Invalid JSON in either variable yields an empty dict
+            teams=_parse_json_env(os.getenv("JIRA_TEAMS", "{}")),
+            component_aliases=_parse_json_env(
+                os.getenv("JIRA_COMPONENT_ALIASES", "{}")
+            ),
         )
 
     def validate_required_fields(self) -> None:
@@ -151,11 +152,8 @@ class JiraConfig(BaseModel):
         Returns:
             Actual component name
         """
-        # If it's an alias, return the actual name
-        if alias_or_name in self.component_aliases:
-            return self.component_aliases[alias_or_name]
-        # Otherwise return the input as-is (assuming it's the actual component name)
-        return alias_or_name
+        # Names that aren't aliases are assumed to be actual component names
+        return self.component_aliases.get(alias_or_name, alias_or_name)
 
     def resolve_component_names(self, aliases_or_names: List[str]) -> List[str]:
         """Resolve a list of component aliases to actual component names.
@@ -166,7 +164,8 @@ class JiraConfig(BaseModel):
         Returns:
             List of actual component names
         """
-        return [self.get_component_name(item) for item in aliases_or_names]
+        get = self.component_aliases.get
+        return [get(name, name) for name in aliases_or_names]
 
     def add_component_alias(self, alias: str, component_name: str) -> None:
         """Add or update a component alias.
@@ -68,7 +68,7 @@ def main() -> None:
     except KeyboardInterrupt:
         logging.info("Server stopped")
     except Exception as e:
-        logging.error(f"Failed to start server: {e}")
+        logging.error("Failed to start server: %s", e)
         sys.exit(1)
 
 
@@ -16,13 +16,30 @@
 
 """Main MCP server implementation for Jira."""
 
+import asyncio
+import functools
+import importlib.util
 import logging
 import os
+import re
 import subprocess
-from typing import Any, Dict, List, Optional
+from contextlib import asynccontextmanager
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Union,
+    get_type_hints,
+)
 
 from fastmcp import Context, FastMCP
-from pydantic import BaseModel
+from fastmcp.utilities.types import get_cached_typeadapter
+from pydantic import BaseModel, ConfigDict, TypeAdapter
+from pydantic.dataclasses import dataclass as pydantic_dataclass
 
 from .client import JiraClient
 from .config import JiraConfig
@@ -36,6 +53,9 @@ logger = logging.getLogger(__name__)
 # Any status not in this set will require fix_version before transitioning
 EARLY_STATUSES = {"new", "backlog", "in progress"}
 
+# A full SHA-1 (40) or SHA-256 (64) git commit hash
+_GIT_SHA_RE = re.compile(r"[0-9a-fA-F]{40}|[0-9a-fA-F]{64}")
+
 
 def _validate_git_commit_sha(sha: str) -> None:
     """Validate that a git commit SHA is either 40 characters (SHA-1) or 64 characters (SHA-256).
@@ -49,34 +69,205 @@ def _validate_git_commit_sha(sha: str) -> None:
     if not sha:
         return
 
-    # Check if it's all hexadecimal characters
-    if not all(c in "0123456789abcdefABCDEF" for c in sha):
-        raise ValueError(
-            f"Git commit SHA must contain only hexadecimal characters: {sha}"
-        )
+    if _GIT_SHA_RE.fullmatch(sha):
+        return
 
-    # Check length - must be either 40 (SHA-1) or 64 (SHA-256) characters
-    if len(sha) not in [40, 64]:
+    # Invalid; work out which rule failed for the error message
+    if len(sha) not in (40, 64):
         raise ValueError(
             f"Git commit SHA must be either 40 characters (SHA-1) or 64 characters (SHA-256), got {len(sha)} characters: {sha}"
         )
+    raise ValueError(f"Git commit SHA must contain only hexadecimal characters: {sha}")
+
+
+# PROJECT-123 style keys (Jira matches them case-insensitively) or numeric IDs
+_ISSUE_KEY_RE = re.compile(r"[A-Za-z][A-Za-z0-9_]*-[0-9]+|[0-9]+")
+
+
+def _validate_issue_key(issue_key: str) -> None:
+    """Reject a malformed issue key before it costs a round-trip to Jira.
+
+    Args:
+        issue_key: Jira issue key (e.g., 'PROJ-123') or numeric issue ID
+
+    Raises:
+        ValueError: If the key is neither
+    """
+    if not _ISSUE_KEY_RE.fullmatch(issue_key):
+        raise ValueError(f"Invalid issue key: {issue_key!r}")
+
+
+def _jql_quote(value: str) -> str:
+    """Quote a value as a JQL string literal."""
+    escaped = value.replace("\\", "\\\\").replace('"', '\\"')
+    return f'"{escaped}"'
+
+
+def _name_ref(value: Any) -> Dict[str, Any]:
+    return {"name": value}
+
+
+def _name_refs(values: List[str]) -> List[Dict[str, Any]]:
+    return [{"name": value} for value in values]
+
+
+def _passthrough(value: Any) -> Any:
+    return value
+
+
+# (tool argument, Jira field ID, transform) for issue fields that map straight
+# from a tool argument. Components, story points and the assignee need more
+# than a transform and are handled in JiraMCPServer._build_issue_fields.
+_FIELD_SPEC: Tuple[Tuple[str, str, Callable[[Any], Any]], ...] = (
+    ("summary", "summary", _passthrough),
+    ("description", "description", _passthrough),
+    ("priority", "priority", _name_ref),
+    ("labels", "labels", _passthrough),
+    ("fix_versions", "fixVersions", _name_refs),
+    ("target_version", "customfield_10855", _name_refs),  # Target Version
+    ("work_type", "customfield_10464", lambda v: {"id": str(v)}),  # Activity Type
+    ("security_level", "security", _name_ref),
+    ("due_date", "duedate", _passthrough),
+    ("target_start", "customfield_10022", _passthrough),  # Target Start
+    ("target_end", "customfield_10023", _passthrough),  # Target End
+    ("original_estimate", "timetracking", lambda v: {"originalEstimate": v}),
+    ("git_commit", "customfield_10583", _passthrough),  # Git Commit
+    ("git_pull_requests", "customfield_10875", _passthrough),  # Git Pull Requests
+    ("parent", "parent", lambda v: {"key": v}),
+    ("epic_name", "customfield_10011", _passthrough),  # Epic Name
+)
+
+
+def _build_fields(values: Dict[str, Any]) -> Dict[str, Any]:
+    """Map provided tool arguments to Jira fields using ``_FIELD_SPEC``."""
+    return {
+        key: transform(values[arg])
+        for arg, key, transform in _FIELD_SPEC
+        if values.get(arg)
+    }
+
+
+@functools.lru_cache(maxsize=128)
+def _team_jql(
+    members: Tuple[str, ...], project_key: Optional[str], status: Optional[str]
+) -> str:
+    """Build the JQL matching issues assigned to any of the given members.
+
+    Keyed on the member tuple itself, so a team edited with add_team gets
+    fresh JQL instead of a stale cached string.
+    """
+    # Build JQL query for assignee in team members
+    quoted = ", ".join(_jql_quote(member) for member in members)
+    jql_parts = [f"assignee in ({quoted})"]
+
+    # Add optional filters
+    if project_key:
+        jql_parts.insert(0, f"project = {project_key}")
+
+    if status:
+        jql_parts.append(f"status = {_jql_quote(status)}")
+
+    return " AND ".join(jql_parts)
+
+
+def _format_issue_resource(issue: Dict[str, Any]) -> str:
+    """Render a JiraClient issue dict as the markdown served by jira://issue/{key}."""
+    # A single f-string is the cheapest way to build this in CPython: both a
+    # str.format_map template and a list of parts joined at the end measured
+    # slower
+    return f"""# {issue['key']}: {issue['summary']}
+
+**Status:** {issue['status']}
+**Priority:** {issue['priority']}
+**Type:** {issue['issue_type']}
+**Project:** {issue['project']}
+**Assignee:** {issue['assignee'] or 'Unassigned'}
+**Reporter:** {issue['reporter']}
+
+## Description
+{issue['description']}
+
+## Details
+- **Created:** {issue['created']}
+- **Updated:** {issue['updated']}
+- **Resolution:** {issue['resolution'] or 'Unresolved'}
+- **Labels:** {', '.join(issue['labels']) if issue['labels'] else 'None'}
+- **Components:** {', '.join(issue['components']) if issue['components'] else 'None'}
+- **Fix Versions:** {', '.join(issue['fix_versions']) if issue['fix_versions'] else 'None'}
+- **Target Version:** {', '.join(issue['target_version']) if issue['target_version'] else 'None'}
+- **Work Type:** {issue['work_type'] or 'None'}
+- **Security Level:** {issue['security_level'] or 'None'}
+- **Due Date:** {issue['due_date'] or 'None'}
+- **Target Start:** {issue['target_start'] or 'None'}
+- **Target End:** {issue['target_end'] or 'None'}
+- **Original Estimate:** {issue['original_estimate'] or 'None'}
+- **Story Points:** {issue['story_points'] or 'None'}
+- **Git Commit:** {issue['git_commit'] or 'None'}
+- **Git Pull Requests:** {issue['git_pull_requests'] or 'None'}
+
+**URL:** {issue['url']}
+"""
+
+
+def _format_projects_resource(projects: List[Dict[str, Any]]) -> str:
+    """Render JiraClient project dicts as the markdown served by jira://projects."""
+    parts = ["# Jira Projects\n\n"]
+    for project in projects:
+        parts.append(f"## {project['key']}: {project['name']}\n")
+        if project["description"]:
+            parts.append(f"{project['description']}\n")
+        parts.append(f"**Lead:** {project['lead']}\n\n")
+    return "".join(parts)
+
+
+class _NullContext:
+    """No-op stand-in for the MCP ``Context`` when a tool is called without one."""
+
+    async def info(self, message: str, *args: Any, **kwargs: Any) -> None:
+        pass
+
+    async def warning(self, message: str, *args: Any, **kwargs: Any) -> None:
+        pass
+
+    async def error(self, message: str, *args: Any, **kwargs: Any) -> None:
+        pass
+
+
+_NULL_CTX = _NullContext()
 
 
 # Pydantic models for structured responses
-class SubtaskResponse(BaseModel):
+class _ResponseModel(BaseModel):
+    """Base for tool responses; instances are immutable once built.
+
+    Keys the client adds beyond a model's fields are dropped rather than stored.
+    """
+
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
+
+class SubtaskResponse(_ResponseModel):
     key: str
     summary: str
     status: str
     issue_type: str
 
 
-class ParentResponse(BaseModel):
+class ParentResponse(_ResponseModel):
     key: str
     summary: str
     issue_type: str
 
 
-class IssueResponse(BaseModel):
+class CommentResponse(_ResponseModel):
+    id: str
+    body: str
+    author: str
+    created: str
+    updated: str
+
+
+class IssueResponse(_ResponseModel):
     key: str
     summary: str
     description: str
@@ -91,7 +282,7 @@ class IssueResponse(BaseModel):
     resolution: Optional[str]
     labels: List[str]
     components: List[str]
-    comments: List["CommentResponse"]
+    comments: List[CommentResponse]
     url: str
     fix_versions: List[str]
     target_version: List[str]
@@ -108,14 +299,14 @@ class IssueResponse(BaseModel):
     parent: Optional[ParentResponse]
 
 
-class ProjectResponse(BaseModel):
+class ProjectResponse(_ResponseModel):
     key: str
     name: str
     description: str
     lead: str
 
 
-class VersionResponse(BaseModel):
+class VersionResponse(_ResponseModel):
     id: str
     name: str
     description: str
@@ -124,7 +315,7 @@ class VersionResponse(BaseModel):
     release_date: Optional[str]
 
 
-class ComponentResponse(BaseModel):
+class ComponentResponse(_ResponseModel):
     id: str
     name: str
     description: str
@@ -133,15 +324,7 @@ class ComponentResponse(BaseModel):
     is_assignee_type_valid: bool
 
 
-class CommentResponse(BaseModel):
-    id: str
-    body: str
-    author: str
-    created: str
-    updated: str
-
-
-class WorkLogResponse(BaseModel):
+class WorkLogResponse(_ResponseModel):
     id: str
     time_spent: str
     comment: str
@@ -150,7 +333,7 @@ class WorkLogResponse(BaseModel):
     started: str
 
 
-class LinkResponse(BaseModel):
+class LinkResponse(_ResponseModel):
     link_type: str
     inward_issue: str
     outward_issue: str
@@ -160,14 +343,14 @@ class LinkResponse(BaseModel):
     created: bool
 
 
-class LinkTypeResponse(BaseModel):
+class LinkTypeResponse(_ResponseModel):
     id: str
     name: str
     inward: str
     outward: str
 
 
-class UserResponse(BaseModel):
+class UserResponse(_ResponseModel):
     account_id: Optional[str]
     name: Optional[str]
     display_name: str
@@ -175,14 +358,17 @@ class UserResponse(BaseModel):
     active: bool
 
 
-class WatcherResponse(BaseModel):
+# Issues can have hundreds of watchers; a slotted dataclass is about a quarter
+# of the size of a model instance and validates and serializes faster
+@pydantic_dataclass(slots=True, frozen=True, config=ConfigDict(extra="ignore"))
+class WatcherResponse:
     username: str
     display_name: str
     email: Optional[str]
     active: bool
 
 
-class TeamAssignmentResponse(BaseModel):
+class TeamAssignmentResponse(_ResponseModel):
     issue_key: str
     team_name: str
     successes: List[str]
@@ -191,20 +377,71 @@ class TeamAssignmentResponse(BaseModel):
     total_failed: int
 
 
-class TeamInfoResponse(BaseModel):
+class TeamInfoResponse(_ResponseModel):
     teams: Dict[str, List[str]]
 
 
-class ComponentAliasResponse(BaseModel):
+class ComponentAliasResponse(_ResponseModel):
     aliases: Dict[str, str]
 
 
+# Result sets larger than this are validated in a worker thread so that a
+# single big search does not stall other requests on the event loop
+_OFFLOAD_THRESHOLD = 50
+
+_ISSUE_LIST_ADAPTER = TypeAdapter(List[IssueResponse])
+_WATCHER_LIST_ADAPTER = TypeAdapter(List[WatcherResponse])
+
+
+async def _to_issue_responses(issues: List[Dict[str, Any]]) -> List[IssueResponse]:
+    """Validate a list of issues in one pass, off the event loop for large ones."""
+    if len(issues) <= _OFFLOAD_THRESHOLD:
+        return _ISSUE_LIST_ADAPTER.validate_python(issues)
+    return await asyncio.to_thread(_ISSUE_LIST_ADAPTER.validate_python, issues)
+
+
 class JiraMCPServer:
     """MCP Server for Jira integration."""
 
+    # Methods registered as MCP tools, in registration order
+    _TOOLS: Tuple[str, ...] = (
+        "search_issues",
+        "search_issues_by_team",
+        "get_issue",
+        "create_issue",
+        "update_issue",
+        "clear_field",
+        "transition_issue",
+        "add_comment",
+        "log_time",
+        "get_projects",
+        "get_project_versions",
+        "get_project_components",
+        "link_issue",
+        "get_link_types",
+        "debug_issue_fields",
+        "search_users",
+        "assign_team_to_issue",
+        "add_watcher_to_issue",
+        "remove_watcher_from_issue",
+        "get_issue_watchers",
+        "list_teams",
+        "add_team",
+        "remove_team",
+        "list_component_aliases",
+        "add_component_alias",
+        "remove_component_alias",
+    )
+
+    # (URI template, method) pairs registered as MCP resources
+    _RESOURCES: Tuple[Tuple[str, str], ...] = (
+        ("jira://issue/{issue_key}", "get_issue_resource"),
+        ("jira://projects", "get_projects_resource"),
+    )
+
     def __init__(self) -> None:
         """Initialize the Jira MCP server."""
-        self.mcp = FastMCP("Jira MCP Server")
+        self.mcp = FastMCP("Jira MCP Server", lifespan=self._lifespan)
         self.config = JiraConfig.from_env()
         self.client = JiraClient(self.config)
         self._update_warning: Optional[str] = None
@@ -213,1096 +450,993 @@ class JiraMCPServer:
         self._setup_resources()
 
     def _setup_tools(self) -> None:
-        """Set up MCP tools for Jira operations."""
-
-        @self.mcp.tool()
-        async def search_issues(
-            jql: str, max_results: int = 100, ctx: Optional[Context] = None
-        ) -> List[IssueResponse]:
-            """Search for Jira issues using JQL (Jira Query Language).
-
-            Args:
-                jql: JQL query string (e.g., 'project = PROJ AND status = Open')
-                max_results: Maximum number of results to return (default: 100)
-                ctx: MCP context for progress reporting
-            """
-            await self._emit_update_warning(ctx)
-            if ctx:
-                await ctx.info(f"Searching issues with JQL: {jql}")
-
-            try:
-                issues = await self.client.search_issues(jql, max_results)
-                if ctx:
-                    await ctx.info(f"Found {len(issues)} issues")
-                return [IssueResponse(**issue) for issue in issues]
-            except Exception as e:
-                if ctx:
-                    await ctx.error(f"Search failed: {str(e)}")
-                raise
-
-        @self.mcp.tool()
-        async def search_issues_by_team(
-            team_name: str,
-            project_key: Optional[str] = None,
-            status: Optional[str] = None,
-            max_results: int = 100,
-            ctx: Optional[Context] = None,
-        ) -> List[IssueResponse]:
-            """Search for issues assigned to any member of a team.
-
-            This tool finds all issues where the assignee is one of the team members.
-            It automatically constructs the appropriate JQL query based on the team configuration.
-
-            Args:
-                team_name: Name of the team to search for
-                project_key: Optional project key to filter results (e.g., 'PROJ')
-                status: Optional status to filter results (e.g., 'Open', 'In Progress')
-                max_results: Maximum number of results to return (default: 100)
-                ctx: MCP context for progress reporting
-            """
-            await self._emit_update_warning(ctx)
-            if ctx:
-                await ctx.info(f"Searching issues assigned to team '{team_name}'")
+        """Set up MCP tools for Jira operations.
 
-            try:
-                # Get team members
-                team_members = self.config.get_team_members(team_name)
+        The adapter FastMCP serializes each tool's result with is built here as
+        well, so the first call of a tool doesn't pay for schema generation.
+        """
+        for name in self._TOOLS:
+            tool = getattr(self, name)
+            self.mcp.tool(tool)
+            get_cached_typeadapter(get_type_hints(tool)["return"])
+
+    async def search_issues(
+        self,
+        jql: str,
+        max_results: int = 100,
+        raw: bool = False,
+        ctx: Optional[Context] = None,
+    ) -> Union[List[IssueResponse], List[Dict[str, Any]]]:
+        """Search for Jira issues using JQL (Jira Query Language).
 
-                if not team_members:
-                    raise ValueError(f"Team '{team_name}' has no members")
+        Args:
+            jql: JQL query string (e.g., 'project = PROJ AND status = Open')
+            max_results: Maximum number of results to return (default: 100)
+            raw: Return the plain issue dictionaries without model validation
+                (faster for large result sets; default: False)
+            ctx: MCP context for progress reporting
+        """
+        await self._emit_update_warning(ctx)
+        log = ctx or _NULL_CTX
+        info, error = log.info, log.error
+        await info(f"Searching issues with JQL: {jql}")
 
-                # Build JQL query for assignee in team members
-                assignee_clause = " OR ".join(
-                    [f'assignee = "{member}"' for member in team_members]
-                )
-                jql_parts = [f"({assignee_clause})"]
+        try:
+            if max_results < 1:
+                raise ValueError("max_results must be at least 1")
+            issues = await self.client.search_issues(jql, max_results)
+            await info(f"Found {len(issues)} issues")
+            if raw:
+                return issues
+            return await _to_issue_responses(issues)
+        except Exception as e:
+            await error(f"Search failed: {str(e)}")
+            raise
 
-                # Add optional filters
-                if project_key:
-                    jql_parts.insert(0, f"project = {project_key}")
+    async def search_issues_by_team(
+        self,
+        team_name: str,
+        project_key: Optional[str] = None,
+        status: Optional[str] = None,
+        max_results: int = 100,
+        ctx: Optional[Context] = None,
+    ) -> List[IssueResponse]:
+        """Search for issues assigned to any member of a team.
 
-                if status:
-                    jql_parts.append(f'status = "{status}"')
+        This tool finds all issues where the assignee is one of the team members.
+        It automatically constructs the appropriate JQL query based on the team configuration.
 
-                jql = " AND ".join(jql_parts)
+        Args:
+            team_name: Name of the team to search for
+            project_key: Optional project key to filter results (e.g., 'PROJ')
+            status: Optional status to filter results (e.g., 'Open', 'In Progress')
+            max_results: Maximum number of results to return (default: 100)
+            ctx: MCP context for progress reporting
+        """
+        await self._emit_update_warning(ctx)
+        log = ctx or _NULL_CTX
+        info, error = log.info, log.error
 
-                if ctx:
-                    await ctx.info(f"Generated JQL: {jql}")
-                    await ctx.info(
-                        f"Searching for issues assigned to: {', '.join(team_members)}"
-                    )
+        try:
+            if max_results < 1:
+                raise ValueError("max_results must be at least 1")
 
-                # Execute search
-                issues = await self.client.search_issues(jql, max_results)
+            # Get team members
+            team_members = self.config.get_team_members(team_name)
 
-                if ctx:
-                    await ctx.info(
-                        f"Found {len(issues)} issues assigned to team '{team_name}'"
-                    )
+            if not team_members:
+                raise ValueError(f"Team '{team_name}' has no members")
 
-                return [IssueResponse(**issue) for issue in issues]
+            jql = _team_jql(tuple(team_members), project_key, status)
 
-            except Exception as e:
-                if ctx:
-                    await ctx.error(
-                        f"Failed to search issues for team '{team_name}': {str(e)}"
-                    )
-                raise
-
-        @self.mcp.tool()
-        async def get_issue(
-            issue_key: str, ctx: Optional[Context] = None
-        ) -> IssueResponse:
-            """Get detailed information about a specific Jira issue.
-
-            Args:
-                issue_key: Jira issue key (e.g., 'PROJ-123')
-                ctx: MCP context for progress reporting
-            """
-            await self._emit_update_warning(ctx)
-            if ctx:
-                await ctx.info(f"Fetching issue: {issue_key}")
-
-            try:
-                issue = await self.client.get_issue(issue_key)
-                return IssueResponse(**issue)
-            except Exception as e:
-                if ctx:
-                    await ctx.error(f"Failed to get issue {issue_key}: {str(e)}")
-                raise
-
-        @self.mcp.tool()
-        async def create_issue(
-            project_key: str,
-            summary: str,
-            description: str,
-            priority: str = "Normal",
-            work_type: Optional[str] = None,
-            components: Optional[List[str]] = None,
-            target_version: Optional[List[str]] = None,
-            issue_type: str = "Task",
-            due_date: Optional[str] = None,
-            assignee: Optional[str] = None,
-            team: Optional[str] = None,
-            labels: Optional[List[str]] = None,
-            fix_versions: Optional[List[str]] = None,
-            security_level: Optional[str] = "Red Hat Employee",
-            target_start: Optional[str] = None,
-            target_end: Optional[str] = None,
-            original_estimate: Optional[str] = None,
-            story_points: Optional[float] = None,
-            git_commit: Optional[str] = None,
-            git_pull_requests: Optional[str] = None,
-            parent: Optional[str] = None,
-            epic_name: Optional[str] = None,
-            ctx: Optional[Context] = None,
-        ) -> IssueResponse:
-            """Create a new Jira issue.
-
-            ⚠️ WARNING: Issues created in Jira CANNOT BE UNDONE. Issues are permanent records and cannot be deleted.
-            Only create issues when explicitly requested by the user. Never use for testing or if uncertain about parameters.
-
-            Args:
-                project_key: Project key (e.g., 'PROJ')
-                summary: Issue summary/title
-                description: Issue description
-                issue_type: Issue type (e.g., 'Bug', 'Task', 'Story', 'Sub-task')
-                priority: Issue priority (defaults to 'Normal')
-                assignee: Username of assignee
-                team: Team name to add as watchers (all team members will be added as watchers)
-                labels: List of labels to add
-                fix_versions: List of fix version names (set when issue is closed)
-                target_version: List of target version names (set when issue is created)
-                work_type: Work type for the issue (STRONGLY RECOMMENDED). Available options:
-                    - **None** = -1
-                    - **Associate Wellness & Development** = 10604
-                    - **BU Features** = 10605
-                    - **Future Sustainability** = 10606
-                    - **Incidents & Support** = 10607
-                    - **Quality / Stability / Reliability** = 10608
-                    - **Security & Compliance** = 10609
-                    - **Product / Portfolio Work** = 10610
-                security_level: Security level name
-                due_date: Due date in YYYY-MM-DD format
-                target_start: Target start date in YYYY-MM-DD format
-                target_end: Target end date in YYYY-MM-DD format
-                components: List of component names (STRONGLY RECOMMENDED)
-                original_estimate: Original time estimate (e.g., '1h 30m'). RECOMMENDED for better estimation tracking.
-                story_points: Story points value. RECOMMENDED for better sprint planning.
-                git_commit: Git commit hash or reference
-                git_pull_requests: Git pull requests, comma separated list of pull requests URLs
-                parent: Parent issue key for hierarchy (e.g., 'PROJ-123'). Works
-                    for all hierarchy levels: Story to Epic, Epic to Feature,
-                    sub-tasks, etc.
-                epic_name: Epic Name (required for Epic issue type)
-                ctx: MCP context for progress reporting
-            """
-            # Validate required fields
-            if not summary or not summary.strip():
-                raise ValueError("Summary cannot be empty")
-            if not description or not description.strip():
-                raise ValueError("Description cannot be empty")
-
-            # Validate optional fields if provided
-            if assignee is not None and (not assignee or not assignee.strip()):
-                raise ValueError("Assignee cannot be empty")
-            if fix_versions is not None and (
-                not fix_versions or len(fix_versions) == 0
-            ):
-                raise ValueError("Fix versions cannot be empty")
-
-            await self._emit_update_warning(ctx)
-            if ctx:
-                await ctx.info(f"Creating issue in project {project_key}")
-
-            fields: Dict[str, Any] = {}
-            if priority:
-                fields["priority"] = {"name": priority}
-            if assignee:
-                fields["assignee"] = await self.client.resolve_assignee(assignee)
-            if labels:
-                # Labels are passed as array of strings directly to Jira API
-                fields["labels"] = labels
-            if fix_versions:
-                # Fix versions need to be converted to objects with 'name' property
-                fields["fixVersions"] = [{"name": version} for version in fix_versions]
-            if target_version:
-                # Target versions need to be converted to objects with 'name' property
-                fields["customfield_10855"] = [
-                    {"name": version} for version in target_version
-                ]
-            if work_type:
-                fields["customfield_10464"] = {
-                    "id": str(work_type)
-                }  # Activity Type (formerly Work Type)
-            if security_level:
-                fields["security"] = {"name": security_level}
-            if due_date:
-                fields["duedate"] = due_date
-            if target_start:
-                fields["customfield_10022"] = target_start  # Target Start custom field
-            if target_end:
-                fields["customfield_10023"] = target_end  # Target End custom field
-            if components:
-                # Resolve component aliases to actual component names
-                resolved_components = self.config.resolve_component_names(components)
-                # Components need to be converted to objects with 'name' property
-                fields["components"] = [
-                    {"name": component} for component in resolved_components
-                ]
-            if original_estimate:
-                fields["timetracking"] = {"originalEstimate": original_estimate}
-            if story_points is not None:
-                fields["customfield_10028"] = story_points  # Story points custom field
-            if git_commit:
-                _validate_git_commit_sha(git_commit)
-                fields["customfield_10583"] = git_commit  # Git Commit custom field
-            if git_pull_requests:
-                fields["customfield_10875"] = (
-                    git_pull_requests  # Git Pull Requests custom field
-                )
-            if parent:
-                fields["parent"] = {"key": parent}
-            if epic_name:
-                fields["customfield_10011"] = epic_name
-
-            try:
-                issue = await self.client.create_issue(
-                    project_key, summary, description, issue_type, **fields
-                )
-                if ctx:
-                    await ctx.info(f"Created issue: {issue['key']}")
-
-                # If a team is specified, add team members as watchers
-                if team:
-                    try:
-                        team_members = self.config.get_team_members(team)
-                        if ctx:
-                            await ctx.info(
-                                f"Adding {len(team_members)} team members as watchers"
-                            )
-                        await self.client.add_team_as_watchers(
-                            issue["key"], team_members
-                        )
-                    except Exception as team_error:
-                        if ctx:
-                            await ctx.warning(
-                                f"Failed to add team watchers: {str(team_error)}"
-                            )
-
-                return IssueResponse(**issue)
-            except Exception as e:
-                if ctx:
-                    await ctx.error(f"Failed to create issue: {str(e)}")
-                raise
-
-        @self.mcp.tool()
-        async def update_issue(
-            issue_key: str,
-            priority: Optional[str] = None,
-            work_type: Optional[str] = None,
-            components: Optional[List[str]] = None,
-            due_date: Optional[str] = None,
-            summary: Optional[str] = None,
-            description: Optional[str] = None,
-            assignee: Optional[str] = None,
-            labels: Optional[List[str]] = None,
-            fix_versions: Optional[List[str]] = None,
-            target_version: Optional[List[str]] = None,
-            security_level: Optional[str] = None,
-            target_start: Optional[str] = None,
-            target_end: Optional[str] = None,
-            original_estimate: Optional[str] = None,
-            story_points: Optional[float] = None,
-            git_commit: Optional[str] = None,
-            git_pull_requests: Optional[str] = None,
-            parent: Optional[str] = None,
-            ctx: Optional[Context] = None,
-        ) -> IssueResponse:
-            """Update an existing Jira issue.
-
-            Args:
-                issue_key: Jira issue key (e.g., 'PROJ-123')
-                summary: New summary/title
-                description: New description
-                priority: New priority
-                assignee: New assignee username
-                labels: New labels list
-                fix_versions: List of fix version names (set when issue is closed)
-                target_version: List of target version names (set when issue is created)
-                work_type: Work type for the issue (STRONGLY RECOMMENDED). Available options:
-                    - **None** = -1
-                    - **Associate Wellness & Development** = 10604
-                    - **BU Features** = 10605
-                    - **Future Sustainability** = 10606
-                    - **Incidents & Support** = 10607
-                    - **Quality / Stability / Reliability** = 10608
-                    - **Security & Compliance** = 10609
-                    - **Product / Portfolio Work** = 10610
-                security_level: Security level name
-                due_date: Due date in YYYY-MM-DD format
-                target_start: Target start date in YYYY-MM-DD format
-                target_end: Target end date in YYYY-MM-DD format
-                components: List of component names (STRONGLY RECOMMENDED)
-                original_estimate: Original time estimate (e.g., '1h 30m')
-                story_points: Story points value
-                git_commit: Git commit hash or reference
-                git_pull_requests: Git pull requests, comma separated list of pull requests URLs
-                parent: Parent issue key for hierarchy (e.g., 'PROJ-123'). Works
-                    for all hierarchy levels: Story to Epic, Epic to Feature,
-                    sub-tasks, etc.
-                ctx: MCP context for progress reporting
-            """
             if ctx:
-                await ctx.info(f"Updating issue: {issue_key}")
-
-            fields: Dict[str, Any] = {}
-            if summary:
-                fields["summary"] = summary
-            if description:
-                fields["description"] = description
-            if priority:
-                fields["priority"] = {"name": priority}
-            if assignee:
-                fields["assignee"] = await self.client.resolve_assignee(assignee)
-            if labels:
-                # Labels are passed as array of strings directly to Jira API
-                fields["labels"] = labels
-            if fix_versions:
-                # Fix versions need to be converted to objects with 'name' property
-                fields["fixVersions"] = [{"name": version} for version in fix_versions]
-            if target_version:
-                # Target versions need to be converted to objects with 'name' property
-                fields["customfield_10855"] = [
-                    {"name": version} for version in target_version
-                ]
-            if work_type:
-                fields["customfield_10464"] = {
-                    "id": str(work_type)
-                }  # Activity Type (formerly Work Type)
-            if security_level:
-                fields["security"] = {"name": security_level}
-            if due_date:
-                fields["duedate"] = due_date
-            if target_start:
-                fields["customfield_10022"] = target_start  # Target Start custom field
-            if target_end:
-                fields["customfield_10023"] = target_end  # Target End custom field
-            if components:
-                # Resolve component aliases to actual component names
-                resolved_components = self.config.resolve_component_names(components)
-                # Components need to be converted to objects with 'name' property
-                fields["components"] = [
-                    {"name": component} for component in resolved_components
-                ]
-            if original_estimate:
-                fields["timetracking"] = {"originalEstimate": original_estimate}
-            if story_points is not None:
-                fields["customfield_10028"] = story_points  # Story points custom field
-            if git_commit:
-                _validate_git_commit_sha(git_commit)
-                fields["customfield_10583"] = git_commit  # Git Commit custom field
-            if git_pull_requests:
-                fields["customfield_10875"] = (
-                    git_pull_requests  # Git Pull Requests custom field
+                # Skip joining the member list when nobody is listening
+                await info(
+                    f"Searching issues assigned to team '{team_name}'\n"
+                    f"Generated JQL: {jql}\n"
+                    f"Searching for issues assigned to: {', '.join(team_members)}"
                 )
-            if parent:
-                fields["parent"] = {"key": parent}
 
-            if not fields:
-                raise ValueError(
-                    "At least one field must be provided to update an issue"
-                )
+            # Execute search
+            issues = await self.client.search_issues(jql, max_results)
 
-            try:
-                issue = await self.client.update_issue(issue_key, **fields)
-                if ctx:
-                    await ctx.info(f"Updated issue: {issue_key}")
-                return IssueResponse(**issue)
-            except Exception as e:
-                if ctx:
-                    await ctx.error(f"Failed to update issue {issue_key}: {str(e)}")
-                raise
-
-        @self.mcp.tool()
-        async def clear_field(
-            issue_key: str, field_name: str, ctx: Optional[Context] = None
-        ) -> IssueResponse:
-            """Clear (unset) a field on a Jira issue.
-
-            Dynamically determines the correct empty value by inspecting the
-            field's schema from the Jira edit metadata.
-
-            Args:
-                issue_key: Jira issue key (e.g., 'PROJ-123')
-                field_name: The Jira field ID to clear (e.g., 'fixVersions',
-                    'customfield_10855', 'duedate', 'labels', 'components',
-                    'assignee', 'priority', 'security', 'timetracking').
-                    Use the debug_issue_fields tool to discover available field IDs.
-                ctx: MCP context for progress reporting
-            """
-            if ctx:
-                await ctx.info(f"Fetching edit metadata for {issue_key}")
+            await info(f"Found {len(issues)} issues assigned to team '{team_name}'")
 
-            editmeta = await self.client.get_editmeta(issue_key)
+            return await _to_issue_responses(issues)
 
-            if field_name not in editmeta:
-                available = ", ".join(sorted(editmeta.keys()))
-                raise ValueError(
-                    f"Field '{field_name}' is not editable on {issue_key}. "
-                    f"Editable fields: {available}"
-                )
+        except Exception as e:
+            await error(f"Failed to search issues for team '{team_name}': {str(e)}")
+            raise
 
-            schema = editmeta[field_name].get("schema", {})
-            field_type = schema.get("type", "")
-
-            # Determine the correct clear value based on schema type
-            clear_value: Any
-            if field_type == "array":
-                clear_value = []
-            elif field_type in ("string", "date", "datetime"):
-                clear_value = None
-            elif field_type == "number":
-                clear_value = None
-            elif field_type == "timetracking":
-                clear_value = {"originalEstimate": "0m"}
-            else:
-                # option, user, security, priority, issuelink, etc.
-                clear_value = None
+    async def get_issue(
+        self, issue_key: str, raw: bool = False, ctx: Optional[Context] = None
+    ) -> Union[IssueResponse, Dict[str, Any]]:
+        """Get detailed information about a specific Jira issue.
 
-            if ctx:
-                await ctx.info(
-                    f"Clearing '{field_name}' (type={field_type}) on {issue_key}"
-                )
+        Args:
+            issue_key: Jira issue key (e.g., 'PROJ-123')
+            raw: Return the plain issue dictionary without model validation
+                (default: False)
+            ctx: MCP context for progress reporting
+        """
+        await self._emit_update_warning(ctx)
+        log = ctx or _NULL_CTX
+        info, error = log.info, log.error
+        await info(f"Fetching issue: {issue_key}")
 
-            try:
-                issue = await self.client.update_issue(
-                    issue_key, **{field_name: clear_value}
-                )
-                if ctx:
-                    await ctx.info(f"Cleared '{field_name}' on {issue_key}")
-                return IssueResponse(**issue)
-            except Exception as e:
-                if ctx:
-                    await ctx.error(
-                        f"Failed to clear '{field_name}' on {issue_key}: {str(e)}"
-                    )
-                raise
-
-        @self.mcp.tool()
-        async def transition_issue(
-            issue_key: str, transition: str, ctx: Optional[Context] = None
-        ) -> IssueResponse:
-            """Transition a Jira issue to a new status.
-
-            Args:
-                issue_key: Jira issue key (e.g., 'PROJ-123')
-                transition: Transition name (e.g., 'Done', 'In Progress')
-                ctx: MCP context for progress reporting
-
-            Note:
-                It is highly recommended to set fix_version on the issue before
-                transitioning to statuses beyond 'New', 'Backlog', and 'In Progress'.
-            """
-            if ctx:
-                await ctx.info(f"Transitioning issue {issue_key} to {transition}")
-
-            try:
-                # Warn if fix_version is not set for statuses beyond early stages
-                if transition.lower() not in EARLY_STATUSES:
-                    current_issue = await self.client.get_issue(issue_key)
-                    fix_versions = current_issue.get("fix_versions", [])
-                    if not fix_versions:
-                        warning_msg = (
-                            f"Warning: {issue_key} is being transitioned to '{transition}' "
-                            f"without a fix_version set. It is highly recommended to set "
-                            f"fix_version before moving beyond 'In Progress'."
-                        )
-                        if ctx:
-                            await ctx.warning(warning_msg)
-                        logger.warning(warning_msg)
-
-                issue = await self.client.transition_issue(issue_key, transition)
-                if ctx:
-                    await ctx.info(f"Transitioned issue {issue_key} to {transition}")
-                return IssueResponse(**issue)
-            except Exception as e:
-                if ctx:
-                    await ctx.error(f"Failed to transition issue {issue_key}: {str(e)}")
-                raise
-
-        @self.mcp.tool()
-        async def add_comment(
-            issue_key: str,
-            comment: str,
-            security_level: Optional[str] = "Red Hat Employee",
-            ctx: Optional[Context] = None,
-        ) -> CommentResponse:
-            """Add a comment to a Jira issue.
-
-            Args:
-                issue_key: Jira issue key (e.g., 'PROJ-123')
-                comment: Comment text
-                security_level: Security level name (default: "Red Hat Employee")
-                ctx: MCP context for progress reporting
-            """
-            if ctx:
-                await ctx.info(f"Adding comment to issue: {issue_key}")
+        try:
+            issue = await self.client.get_issue(issue_key)
+            if raw:
+                return issue
+            return IssueResponse.model_validate(issue)
+        except Exception as e:
+            await error(f"Failed to get issue {issue_key}: {str(e)}")
+            raise
 
-            try:
-                comment_data = await self.client.add_comment(
-                    issue_key, comment, security_level
-                )
-                if ctx:
-                    await ctx.info(f"Added comment to issue: {issue_key}")
-                return CommentResponse(**comment_data)
-            except Exception as e:
-                if ctx:
-                    await ctx.error(f"Failed to add comment to {issue_key}: {str(e)}")
-                raise
-
-        @self.mcp.tool()
-        async def log_time(
-            issue_key: str,
-            time_spent: str,
-            comment: str,
-            started: Optional[str] = None,
-            ctx: Optional[Context] = None,
-        ) -> WorkLogResponse:
-            """Log time spent on a Jira issue with an optional comment.
-
-            Args:
-                issue_key: Jira issue key (e.g., 'PROJ-123')
-                time_spent: Time spent in Jira format (e.g., '1h 30m', '2d 4h', '45m')
-                comment: Comment describing the work done
-                started: Start date/time in ISO format (optional, defaults to now)
-                ctx: MCP context for progress reporting
-            """
-            if ctx:
-                await ctx.info(f"Logging {time_spent} on issue: {issue_key}")
+    async def create_issue(
+        self,
+        project_key: str,
+        summary: str,
+        description: str,
+        priority: str = "Normal",
+        work_type: Optional[str] = None,
+        components: Optional[List[str]] = None,
+        target_version: Optional[List[str]] = None,
+        issue_type: str = "Task",
+        due_date: Optional[str] = None,
+        assignee: Optional[str] = None,
+        team: Optional[str] = None,
+        labels: Optional[List[str]] = None,
+        fix_versions: Optional[List[str]] = None,
+        security_level: Optional[str] = "Red Hat Employee",
+        target_start: Optional[str] = None,
+        target_end: Optional[str] = None,
+        original_estimate: Optional[str] = None,
+        story_points: Optional[float] = None,
+        git_commit: Optional[str] = None,
+        git_pull_requests: Optional[str] = None,
+        parent: Optional[str] = None,
+        epic_name: Optional[str] = None,
+        ctx: Optional[Context] = None,
+    ) -> IssueResponse:
+        """Create a new Jira issue.
+
+        ⚠️ WARNING: Issues created in Jira CANNOT BE UNDONE. Issues are permanent records and cannot be deleted.
+        Only create issues when explicitly requested by the user. Never use for testing or if uncertain about parameters.
 
-            try:
-                work_log = await self.client.log_work(
-                    issue_key, time_spent, comment, started
-                )
-                if ctx:
-                    await ctx.info(f"Successfully logged time on issue: {issue_key}")
-                return WorkLogResponse(**work_log)
-            except Exception as e:
-                if ctx:
-                    await ctx.error(f"Failed to log time on {issue_key}: {str(e)}")
-                raise
-
-        @self.mcp.tool()
-        async def get_projects(ctx: Optional[Context] = None) -> List[ProjectResponse]:
-            """Get all Jira projects accessible to the user.
-
-            Args:
-                ctx: MCP context for progress reporting
-            """
-            if ctx:
-                await ctx.info("Fetching all projects")
-
-            try:
-                projects = await self.client.get_projects()
-                if ctx:
-                    await ctx.info(f"Found {len(projects)} projects")
-                return [ProjectResponse(**project) for project in projects]
-            except Exception as e:
-                if ctx:
-                    await ctx.error(f"Failed to get projects: {str(e)}")
-                raise
-
-        @self.mcp.tool()
-        async def get_project_versions(
-            project_key: str, ctx: Optional[Context] = None
-        ) -> List[VersionResponse]:
-            """Get all versions available in a specific Jira project.
-
-            Useful for finding valid version names when setting fix_versions or target_version on issues.
-
-            Args:
-                project_key: Project key (e.g., 'ACM', 'PROJ')
-                ctx: MCP context for progress reporting
-            """
-            if ctx:
-                await ctx.info(f"Fetching versions for project: {project_key}")
+        Args:
+            project_key: Project key (e.g., 'PROJ')
+            summary: Issue summary/title
+            description: Issue description
+            issue_type: Issue type (e.g., 'Bug', 'Task', 'Story', 'Sub-task')
+            priority: Issue priority (defaults to 'Normal')
+            assignee: Username of assignee
+            team: Team name to add as watchers (all team members will be added as watchers)
+            labels: List of labels to add
+            fix_versions: List of fix version names (set when issue is closed)
+            target_version: List of target version names (set when issue is created)
+            work_type: Work type for the issue (STRONGLY RECOMMENDED). Available options:
+                - **None** = -1
+                - **Associate Wellness & Development** = 10604
+                - **BU Features** = 10605
+                - **Future Sustainability** = 10606
+                - **Incidents & Support** = 10607
+                - **Quality / Stability / Reliability** = 10608
+                - **Security & Compliance** = 10609
+                - **Product / Portfolio Work** = 10610
+            security_level: Security level name
+            due_date: Due date in YYYY-MM-DD format
+            target_start: Target start date in YYYY-MM-DD format
+            target_end: Target end date in YYYY-MM-DD format
+            components: List of component names (STRONGLY RECOMMENDED)
+            original_estimate: Original time estimate (e.g., '1h 30m'). RECOMMENDED for better estimation tracking.
+            story_points: Story points value. RECOMMENDED for better sprint planning.
+            git_commit: Git commit hash or reference
+            git_pull_requests: Git pull requests, comma separated list of pull requests URLs
+            parent: Parent issue key for hierarchy (e.g., 'PROJ-123'). Works
+                for all hierarchy levels: Story to Epic, Epic to Feature,
+                sub-tasks, etc.
+            epic_name: Epic Name (required for Epic issue type)
+            ctx: MCP context for progress reporting
+        """
+        for label, text in (("Summary", summary), ("Description", description)):
+            if not text or not text.strip():
+                raise ValueError(f"{label} cannot be empty")
+        # Assignee is optional, but must not be blank when provided
+        if assignee is not None and not assignee.strip():
+            raise ValueError("Assignee cannot be empty")
+        if fix_versions is not None and not fix_versions:
+            raise ValueError("Fix versions cannot be empty")
+
+        await self._emit_update_warning(ctx)
+        log = ctx or _NULL_CTX
+        info, error = log.info, log.error
+        await info(f"Creating issue in project {project_key}")
+
+        fields = await self._build_issue_fields(
+            priority=priority,
+            assignee=assignee,
+            labels=labels,
+            fix_versions=fix_versions,
+            target_version=target_version,
+            work_type=work_type,
+            security_level=security_level,
+            due_date=due_date,
+            target_start=target_start,
+            target_end=target_end,
+            components=components,
+            original_estimate=original_estimate,
+            story_points=story_points,
+            git_commit=git_commit,
+            git_pull_requests=git_pull_requests,
+            parent=parent,
+            epic_name=epic_name,
+        )
 
-            try:
-                versions = await self.client.get_project_versions(project_key)
-                if ctx:
-                    await ctx.info(
-                        f"Found {len(versions)} versions in project {project_key}"
-                    )
-                return [VersionResponse(**version) for version in versions]
-            except Exception as e:
-                if ctx:
-                    await ctx.error(
-                        f"Failed to get versions for project {project_key}: {str(e)}"
-                    )
-                raise
-
-        @self.mcp.tool()
-        async def get_project_components(
-            project_key: str, ctx: Optional[Context] = None
-        ) -> List[ComponentResponse]:
-            """Get all components available in a specific Jira project.
-
-            Args:
-                project_key: Project key (e.g., 'ACM', 'PROJ')
-                ctx: MCP context for progress reporting
-            """
-            if ctx:
-                await ctx.info(f"Fetching components for project: {project_key}")
+        try:
+            issue = await self.client.create_issue(
+                project_key, summary, description, issue_type, **fields
+            )
 
-            try:
-                components = await self.client.get_project_components(project_key)
-                if ctx:
-                    await ctx.info(
-                        f"Found {len(components)} components in project {project_key}"
+            # If a team is specified, add team members as watchers
+            team_members: List[str] = []
+            team_error = ""
+            if team:
+                try:
+                    team_members = self.config.get_team_members(team)
+                except ValueError as e:
+                    team_error = str(e)
+
+            message = f"Created issue: {issue['key']}"
+            if team_members:
+                message += f"\nAdding {len(team_members)} team members as watchers"
+            await info(message)
+
+            if team_members:
+                try:
+                    result = await self.client.add_team_as_watchers(
+                        issue["key"], team_members
                     )
-                return [ComponentResponse(**component) for component in components]
-            except Exception as e:
-                if ctx:
-                    await ctx.error(
-                        f"Failed to get components for project {project_key}: {str(e)}"
+                    team_error = ", ".join(
+                        f"{failure['username']} ({failure['error']})"
+                        for failure in result["failures"]
                     )
-                raise
-
-        @self.mcp.tool()
-        async def link_issue(
-            link_type: str,
-            inward_issue: str,
-            outward_issue: str,
-            comment: Optional[str] = None,
-            security_level: Optional[str] = None,
-            ctx: Optional[Context] = None,
-        ) -> LinkResponse:
-            """Create a link between two Jira issues.
-
-            Args:
-                link_type: The type of link to create (e.g., 'Blocks', 'Relates', 'Duplicates')
-                inward_issue: The issue key to link from (e.g., 'PROJ-123')
-                outward_issue: The issue key to link to (e.g., 'PROJ-456')
-                comment: Optional comment to add when creating the link
-                security_level: Optional security level for the comment (default: None)
-                ctx: MCP context for progress reporting
-            """
-            if ctx:
-                await ctx.info(
-                    f"Creating link: {inward_issue} {link_type} {outward_issue}"
-                )
+                except Exception as e:
+                    team_error = str(e)
+            if team_error:
+                await log.warning(f"Failed to add team watchers: {team_error}")
 
-            try:
-                link_data = await self.client.create_issue_link(
-                    link_type, inward_issue, outward_issue, comment, security_level
-                )
-                if ctx:
-                    await ctx.info(
-                        f"Successfully created link between {inward_issue} and {outward_issue}"
-                    )
-                return LinkResponse(**link_data)
-            except Exception as e:
-                if ctx:
-                    await ctx.error(f"Failed to create link: {str(e)}")
-                raise
-
-        @self.mcp.tool()
-        async def get_link_types(
-            ctx: Optional[Context] = None,
-        ) -> List[LinkTypeResponse]:
-            """Get all available issue link types.
-
-            Args:
-                ctx: MCP context for progress reporting
-            """
-            if ctx:
-                await ctx.info("Fetching available link types")
-
-            try:
-                link_types = await self.client.get_issue_link_types()
-                if ctx:
-                    await ctx.info(f"Found {len(link_types)} link types")
-                return [LinkTypeResponse(**link_type) for link_type in link_types]
-            except Exception as e:
-                if ctx:
-                    await ctx.error(f"Failed to get link types: {str(e)}")
-                raise
-
-        @self.mcp.tool()
-        async def debug_issue_fields(
-            issue_key: str, ctx: Optional[Context] = None
-        ) -> Dict[str, Any]:
-            """Debug function to show all raw Jira fields for an issue.
-
-            Args:
-                issue_key: Jira issue key (e.g., 'PROJ-123')
-                ctx: MCP context for progress reporting
-            """
-            if ctx:
-                await ctx.info(f"Debugging raw fields for issue: {issue_key}")
-
-            try:
-                raw_issue = await self.client.get_raw_issue_fields(issue_key)
-                if ctx:
-                    await ctx.info(f"Retrieved raw fields for issue: {issue_key}")
-                return raw_issue
-            except Exception as e:
-                if ctx:
-                    await ctx.error(
-                        f"Failed to get raw fields for {issue_key}: {str(e)}"
-                    )
-                raise
-
-        @self.mcp.tool()
-        async def search_users(
-            query: str, max_results: int = 50, ctx: Optional[Context] = None
-        ) -> List[UserResponse]:
-            """Search for Jira users by name, email, or username.
-
-            This tool performs a fuzzy search across user names and email addresses,
-            making it useful for finding a user's Jira ID when you only have partial
-            information.
-
-            Args:
-                query: Search query - can be a partial name, email address, or username.
-                       Examples: "john", "jsmith", "john.smith@company.com"
-                max_results: Maximum number of results to return (default: 50)
-                ctx: MCP context for progress reporting
-
-            Returns:
-                List of matching users with their account_id, name, display_name,
-                email_address, and active status.  When using create_issue or
-                update_issue, the assignee parameter handles accountId resolution
-                automatically.
-            """
-            if ctx:
-                await ctx.info(f"Searching for users matching: {query}")
-
-            try:
-                users = await self.client.search_users(query, max_results)
-                if ctx:
-                    await ctx.info(f"Found {len(users)} matching users")
-                return [UserResponse(**user) for user in users]
-            except Exception as e:
-                if ctx:
-                    await ctx.error(f"Failed to search users: {str(e)}")
-                raise
-
-        @self.mcp.tool()
-        async def assign_team_to_issue(
-            issue_key: str, team_name: str, ctx: Optional[Context] = None
-        ) -> TeamAssignmentResponse:
-            """Assign a team to an issue by adding all team members as watchers.
-
-            Args:
-                issue_key: Jira issue key (e.g., 'PROJ-123')
-                team_name: Name of the team to assign
-                ctx: MCP context for progress reporting
-            """
-            if ctx:
-                await ctx.info(f"Assigning team '{team_name}' to issue: {issue_key}")
+            return IssueResponse.model_validate(issue)
+        except Exception as e:
+            await error(f"Failed to create issue: {str(e)}")
+            raise
 
-            try:
-                team_members = self.config.get_team_members(team_name)
-                result = await self.client.add_team_as_watchers(issue_key, team_members)
+    async def update_issue(
+        self,
+        issue_key: str,
+        priority: Optional[str] = None,
+        work_type: Optional[str] = None,
+        components: Optional[List[str]] = None,
+        due_date: Optional[str] = None,
+        summary: Optional[str] = None,
+        description: Optional[str] = None,
+        assignee: Optional[str] = None,
+        labels: Optional[List[str]] = None,
+        fix_versions: Optional[List[str]] = None,
+        target_version: Optional[List[str]] = None,
+        security_level: Optional[str] = None,
+        target_start: Optional[str] = None,
+        target_end: Optional[str] = None,
+        original_estimate: Optional[str] = None,
+        story_points: Optional[float] = None,
+        git_commit: Optional[str] = None,
+        git_pull_requests: Optional[str] = None,
+        parent: Optional[str] = None,
+        ctx: Optional[Context] = None,
+    ) -> IssueResponse:
+        """Update an existing Jira issue.
 
-                if ctx:
-                    await ctx.info(
-                        f"Added {result['total_added']} watchers, {result['total_failed']} failed"
-                    )
+        Args:
+            issue_key: Jira issue key (e.g., 'PROJ-123')
+            summary: New summary/title
+            description: New description
+            priority: New priority
+            assignee: New assignee username
+            labels: New labels list
+            fix_versions: List of fix version names (set when issue is closed)
+            target_version: List of target version names (set when issue is created)
+            work_type: Work type for the issue (STRONGLY RECOMMENDED). Available options:
+                - **None** = -1
+                - **Associate Wellness & Development** = 10604
+                - **BU Features** = 10605
+                - **Future Sustainability** = 10606
+                - **Incidents & Support** = 10607
+                - **Quality / Stability / Reliability** = 10608
+                - **Security & Compliance** = 10609
+                - **Product / Portfolio Work** = 10610
+            security_level: Security level name
+            due_date: Due date in YYYY-MM-DD format
+            target_start: Target start date in YYYY-MM-DD format
+            target_end: Target end date in YYYY-MM-DD format
+            components: List of component names (STRONGLY RECOMMENDED)
+            original_estimate: Original time estimate (e.g., '1h 30m')
+            story_points: Story points value
+            git_commit: Git commit hash or reference
+            git_pull_requests: Git pull requests, comma separated list of pull requests URLs
+            parent: Parent issue key for hierarchy (e.g., 'PROJ-123'). Works
+                for all hierarchy levels: Story to Epic, Epic to Feature,
+                sub-tasks, etc.
+            ctx: MCP context for progress reporting
+        """
+        log = ctx or _NULL_CTX
+        info, error = log.info, log.error
+        await info(f"Updating issue: {issue_key}")
+
+        fields = await self._build_issue_fields(
+            summary=summary,
+            description=description,
+            priority=priority,
+            assignee=assignee,
+            labels=labels,
+            fix_versions=fix_versions,
+            target_version=target_version,
+            work_type=work_type,
+            security_level=security_level,
+            due_date=due_date,
+            target_start=target_start,
+            target_end=target_end,
+            components=components,
+            original_estimate=original_estimate,
+            story_points=story_points,
+            git_commit=git_commit,
+            git_pull_requests=git_pull_requests,
+            parent=parent,
+        )
 
-                return TeamAssignmentResponse(
-                    issue_key=result["issue_key"],
-                    team_name=team_name,
-                    successes=result["successes"],
-                    failures=result["failures"],
-                    total_added=result["total_added"],
-                    total_failed=result["total_failed"],
-                )
-            except Exception as e:
-                if ctx:
-                    await ctx.error(f"Failed to assign team to {issue_key}: {str(e)}")
-                raise
-
-        @self.mcp.tool()
-        async def add_watcher_to_issue(
-            issue_key: str, username: str, ctx: Optional[Context] = None
-        ) -> Dict[str, Any]:
-            """Add a watcher to an issue.
-
-            Args:
-                issue_key: Jira issue key (e.g., 'PROJ-123')
-                username: Username of the user to add as watcher
-                ctx: MCP context for progress reporting
-            """
-            if ctx:
-                await ctx.info(f"Adding watcher {username} to issue: {issue_key}")
-
-            try:
-                result = await self.client.add_watcher(issue_key, username)
-                if ctx:
-                    await ctx.info(f"Successfully added watcher {username}")
-                return result
-            except Exception as e:
-                if ctx:
-                    await ctx.error(f"Failed to add watcher: {str(e)}")
-                raise
-
-        @self.mcp.tool()
-        async def remove_watcher_from_issue(
-            issue_key: str, username: str, ctx: Optional[Context] = None
-        ) -> Dict[str, Any]:
-            """Remove a watcher from an issue.
-
-            Args:
-                issue_key: Jira issue key (e.g., 'PROJ-123')
-                username: Username of the user to remove as watcher
-                ctx: MCP context for progress reporting
-            """
-            if ctx:
-                await ctx.info(f"Removing watcher {username} from issue: {issue_key}")
-
-            try:
-                result = await self.client.remove_watcher(issue_key, username)
-                if ctx:
-                    await ctx.info(f"Successfully removed watcher {username}")
-                return result
-            except Exception as e:
-                if ctx:
-                    await ctx.error(f"Failed to remove watcher: {str(e)}")
-                raise
-
-        @self.mcp.tool()
-        async def get_issue_watchers(
-            issue_key: str, ctx: Optional[Context] = None
-        ) -> List[WatcherResponse]:
-            """Get all watchers for an issue.
-
-            Args:
-                issue_key: Jira issue key (e.g., 'PROJ-123')
-                ctx: MCP context for progress reporting
-            """
-            if ctx:
-                await ctx.info(f"Getting watchers for issue: {issue_key}")
-
-            try:
-                watchers = await self.client.get_watchers(issue_key)
-                if ctx:
-                    await ctx.info(f"Found {len(watchers)} watchers")
-                return [WatcherResponse(**watcher) for watcher in watchers]
-            except Exception as e:
-                if ctx:
-                    await ctx.error(f"Failed to get watchers: {str(e)}")
-                raise
-
-        @self.mcp.tool()
-        async def list_teams(ctx: Optional[Context] = None) -> TeamInfoResponse:
-            """List all configured teams and their members.
-
-            Args:
-                ctx: MCP context for progress reporting
-            """
-            if ctx:
-                await ctx.info("Listing all teams")
-
-            try:
-                teams = self.config.list_teams()
-                if ctx:
-                    await ctx.info(f"Found {len(teams)} teams")
-                return TeamInfoResponse(teams=teams)
-            except Exception as e:
-                if ctx:
-                    await ctx.error(f"Failed to list teams: {str(e)}")
-                raise
-
-        @self.mcp.tool()
-        async def add_team(
-            team_name: str, members: List[str], ctx: Optional[Context] = None
-        ) -> TeamInfoResponse:
-            """Add or update a team configuration.
-
-            Args:
-                team_name: Name of the team
-                members: List of member usernames
-                ctx: MCP context for progress reporting
-            """
-            if ctx:
-                await ctx.info(
-                    f"Adding/updating team '{team_name}' with {len(members)} members"
-                )
+        if not fields:
+            raise ValueError("At least one field must be provided to update an issue")
 
-            try:
-                self.config.add_team(team_name, members)
-                if ctx:
-                    await ctx.info(f"Successfully added/updated team '{team_name}'")
-                return TeamInfoResponse(teams=self.config.list_teams())
-            except Exception as e:
-                if ctx:
-                    await ctx.error(f"Failed to add team: {str(e)}")
-                raise
-
-        @self.mcp.tool()
-        async def remove_team(
-            team_name: str, ctx: Optional[Context] = None
-        ) -> TeamInfoResponse:
-            """Remove a team configuration.
-
-            Args:
-                team_name: Name of the team to remove
-                ctx: MCP context for progress reporting
-            """
-            if ctx:
-                await ctx.info(f"Removing team '{team_name}'")
-
-            try:
-                self.config.remove_team(team_name)
-                if ctx:
-                    await ctx.info(f"Successfully removed team '{team_name}'")
-                return TeamInfoResponse(teams=self.config.list_teams())
-            except Exception as e:
-                if ctx:
-                    await ctx.error(f"Failed to remove team: {str(e)}")
-                raise
-
-        @self.mcp.tool()
-        async def list_component_aliases(
-            ctx: Optional[Context] = None,
-        ) -> ComponentAliasResponse:
-            """List all configured component aliases.
-
-            Args:
-                ctx: MCP context for progress reporting
-            """
-            if ctx:
-                await ctx.info("Listing all component aliases")
-
-            try:
-                aliases = self.config.list_component_aliases()
-                if ctx:
-                    await ctx.info(f"Found {len(aliases)} component aliases")
-                return ComponentAliasResponse(aliases=aliases)
-            except Exception as e:
-                if ctx:
-                    await ctx.error(f"Failed to list component aliases: {str(e)}")
-                raise
-
-        @self.mcp.tool()
-        async def add_component_alias(
-            alias: str, component_name: str, ctx: Optional[Context] = None
-        ) -> ComponentAliasResponse:
-            """Add or update a component alias configuration.
-
-            Args:
-                alias: Short alias for the component (e.g., 'ui', 'be', 'infra')
-                component_name: Actual component name in Jira (e.g., 'User Interface', 'Backend Services')
-                ctx: MCP context for progress reporting
-            """
-            if ctx:
-                await ctx.info(
-                    f"Adding/updating component alias '{alias}' -> '{component_name}'"
-                )
+        try:
+            issue = await self.client.update_issue(issue_key, **fields)
+            await info(f"Updated issue: {issue_key}")
+            return IssueResponse.model_validate(issue)
+        except Exception as e:
+            await error(f"Failed to update issue {issue_key}: {str(e)}")
+            raise
+
+    async def clear_field(
+        self, issue_key: str, field_name: str, ctx: Optional[Context] = None
+    ) -> IssueResponse:
+        """Clear (unset) a field on a Jira issue.
+
+        Dynamically determines the correct empty value by inspecting the
+        field's schema from the Jira edit metadata.
+
+        Args:
+            issue_key: Jira issue key (e.g., 'PROJ-123')
+            field_name: The Jira field ID to clear (e.g., 'fixVersions',
+                'customfield_10855', 'duedate', 'labels', 'components',
+                'assignee', 'priority', 'security', 'timetracking').
+                Use the debug_issue_fields tool to discover available field IDs.
+            ctx: MCP context for progress reporting
+        """
+        log = ctx or _NULL_CTX
+        info, error = log.info, log.error
+        await info(f"Fetching edit metadata for {issue_key}")
 
-            try:
-                self.config.add_component_alias(alias, component_name)
-                if ctx:
-                    await ctx.info(
-                        f"Successfully added/updated component alias '{alias}'"
+        editmeta = await self.client.get_editmeta(issue_key)
+
+        if field_name not in editmeta:
+            available = ", ".join(sorted(editmeta.keys()))
+            raise ValueError(
+                f"Field '{field_name}' is not editable on {issue_key}. "
+                f"Editable fields: {available}"
+            )
+
+        schema = editmeta[field_name].get("schema", {})
+        field_type = schema.get("type", "")
+
+        # Determine the correct clear value based on schema type
+        clear_value: Any
+        if field_type == "array":
+            clear_value = []
+        elif field_type in ("string", "date", "datetime"):
+            clear_value = None
+        elif field_type == "number":
+            clear_value = None
+        elif field_type == "timetracking":
+            clear_value = {"originalEstimate": "0m"}
+        else:
+            # option, user, security, priority, issuelink, etc.
+            clear_value = None
+
+        await info(f"Clearing '{field_name}' (type={field_type}) on {issue_key}")
+
+        try:
+            issue = await self.client.update_issue(
+                issue_key, **{field_name: clear_value}
+            )
+            await info(f"Cleared '{field_name}' on {issue_key}")
+            return IssueResponse.model_validate(issue)
+        except Exception as e:
+            await error(f"Failed to clear '{field_name}' on {issue_key}: {str(e)}")
+            raise
+
+    async def transition_issue(
+        self, issue_key: str, transition: str, ctx: Optional[Context] = None
+    ) -> IssueResponse:
+        """Transition a Jira issue to a new status.
+
+        Args:
+            issue_key: Jira issue key (e.g., 'PROJ-123')
+            transition: Transition name (e.g., 'Done', 'In Progress')
+            ctx: MCP context for progress reporting
+
+        Note:
+            It is highly recommended to set fix_version on the issue before
+            transitioning to statuses beyond 'New', 'Backlog', and 'In Progress'.
+        """
+        log = ctx or _NULL_CTX
+        info, error = log.info, log.error
+        await info(f"Transitioning issue {issue_key} to {transition}")
+
+        try:
+            # Warn if fix_version is not set for statuses beyond early stages
+            if transition.lower() not in EARLY_STATUSES:
+                current_issue = await self.client.get_issue(issue_key)
+                fix_versions = current_issue.get("fix_versions", [])
+                if not fix_versions:
+                    warning_msg = (
+                        f"Warning: {issue_key} is being transitioned to '{transition}' "
+                        f"without a fix_version set. It is highly recommended to set "
+                        f"fix_version before moving beyond 'In Progress'."
                     )
-                return ComponentAliasResponse(
-                    aliases=self.config.list_component_aliases()
-                )
-            except Exception as e:
-                if ctx:
-                    await ctx.error(f"Failed to add component alias: {str(e)}")
-                raise
-
-        @self.mcp.tool()
-        async def remove_component_alias(
-            alias: str, ctx: Optional[Context] = None
-        ) -> ComponentAliasResponse:
-            """Remove a component alias configuration.
-
-            Args:
-                alias: Alias to remove
-                ctx: MCP context for progress reporting
-            """
-            if ctx:
-                await ctx.info(f"Removing component alias '{alias}'")
-
-            try:
-                self.config.remove_component_alias(alias)
-                if ctx:
-                    await ctx.info(f"Successfully removed component alias '{alias}'")
-                return ComponentAliasResponse(
-                    aliases=self.config.list_component_aliases()
-                )
-            except Exception as e:
-                if ctx:
-                    await ctx.error(f"Failed to remove component alias: {str(e)}")
-                raise
+                    await log.warning(warning_msg)
+                    logger.warning(warning_msg)
 
-    def _setup_resources(self) -> None:
-        """Set up MCP resources for Jira data."""
+            issue = await self.client.transition_issue(issue_key, transition)
+            await info(f"Transitioned issue {issue_key} to {transition}")
+            return IssueResponse.model_validate(issue)
+        except Exception as e:
+            await error(f"Failed to transition issue {issue_key}: {str(e)}")
+            raise
 
-        @self.mcp.resource("jira://issue/{issue_key}")
-        async def get_issue_resource(issue_key: str) -> str:
-            """Get issue details as a formatted resource.
+    async def add_comment(
+        self,
+        issue_key: str,
+        comment: str,
+        security_level: Optional[str] = "Red Hat Employee",
+        ctx: Optional[Context] = None,
+    ) -> CommentResponse:
+        """Add a comment to a Jira issue.
 
-            Args:
-                issue_key: Jira issue key (e.g., 'PROJ-123')
-            """
-            try:
-                issue = await self.client.get_issue(issue_key)
-                return f"""# {issue['key']}: {issue['summary']}
+        Args:
+            issue_key: Jira issue key (e.g., 'PROJ-123')
+            comment: Comment text
+            security_level: Security level name (default: "Red Hat Employee")
+            ctx: MCP context for progress reporting
+        """
+        log = ctx or _NULL_CTX
+        info, error = log.info, log.error
+        await info(f"Adding comment to issue: {issue_key}")
 
-**Status:** {issue['status']}
-**Priority:** {issue['priority']}
-**Type:** {issue['issue_type']}
-**Project:** {issue['project']}
-**Assignee:** {issue['assignee'] or 'Unassigned'}
-**Reporter:** {issue['reporter']}
+        try:
+            comment_data = await self.client.add_comment(
+                issue_key, comment, security_level
+            )
+            await info(f"Added comment to issue: {issue_key}")
+            return CommentResponse(**comment_data)
+        except Exception as e:
+            await error(f"Failed to add comment to {issue_key}: {str(e)}")
+            raise
 
-## Description
-{issue['description']}
+    async def log_time(
+        self,
+        issue_key: str,
+        time_spent: str,
+        comment: str,
+        started: Optional[str] = None,
+        ctx: Optional[Context] = None,
+    ) -> WorkLogResponse:
+        """Log time spent on a Jira issue with an optional comment.
 
-## Details
-- **Created:** {issue['created']}
-- **Updated:** {issue['updated']}
-- **Resolution:** {issue['resolution'] or 'Unresolved'}
-- **Labels:** {', '.join(issue['labels']) if issue['labels'] else 'None'}
-- **Components:** {', '.join(issue['components']) if issue['components'] else 'None'}
-- **Fix Versions:** {', '.join(issue['fix_versions']) if issue['fix_versions'] else 'None'}
-- **Target Version:** {', '.join(issue['target_version']) if issue['target_version'] else 'None'}
-- **Work Type:** {issue['work_type'] or 'None'}
-- **Security Level:** {issue['security_level'] or 'None'}
-- **Due Date:** {issue['due_date'] or 'None'}
-- **Target Start:** {issue['target_start'] or 'None'}
-- **Target End:** {issue['target_end'] or 'None'}
-- **Original Estimate:** {issue['original_estimate'] or 'None'}
-- **Story Points:** {issue['story_points'] or 'None'}
-- **Git Commit:** {issue['git_commit'] or 'None'}
-- **Git Pull Requests:** {issue['git_pull_requests'] or 'None'}
+        Args:
+            issue_key: Jira issue key (e.g., 'PROJ-123')
+            time_spent: Time spent in Jira format (e.g., '1h 30m', '2d 4h', '45m')
+            comment: Comment describing the work done
+            started: Start date/time in ISO format (optional, defaults to now)
+            ctx: MCP context for progress reporting
+        """
+        log = ctx or _NULL_CTX
+        info, error = log.info, log.error
+        await info(f"Logging {time_spent} on issue: {issue_key}")
 
-**URL:** {issue['url']}
-"""
-            except Exception as e:
-                return f"Error fetching issue {issue_key}: {str(e)}"
-
-        @self.mcp.resource("jira://projects")
-        async def get_projects_resource() -> str:
-            """Get all projects as a formatted resource."""
-            try:
-                projects = await self.client.get_projects()
-                result = "# Jira Projects\n\n"
-                for project in projects:
-                    result += f"## {project['key']}: {project['name']}\n"
-                    if project["description"]:
-                        result += f"{project['description']}\n"
-                    result += f"**Lead:** {project['lead']}\n\n"
-                return result
-            except Exception as e:
-                return f"Error fetching projects: {str(e)}"
+        try:
+            work_log = await self.client.log_work(
+                issue_key, time_spent, comment, started
+            )
+            await info(f"Successfully logged time on issue: {issue_key}")
+            return WorkLogResponse(**work_log)
+        except Exception as e:
+            await error(f"Failed to log time on {issue_key}: {str(e)}")
+            raise
+
+    async def get_projects(
+        self, ctx: Optional[Context] = None
+    ) -> List[ProjectResponse]:
+        """Get all Jira projects accessible to the user.
+
+        Args:
+            ctx: MCP context for progress reporting
+        """
+        log = ctx or _NULL_CTX
+        info, error = log.info, log.error
+        await info("Fetching all projects")
+
+        try:
+            projects = await self.client.get_projects()
+            await info(f"Found {len(projects)} projects")
+            return [ProjectResponse(**project) for project in projects]
+        except Exception as e:
+            await error(f"Failed to get projects: {str(e)}")
+            raise
+
+    async def get_project_versions(
+        self, project_key: str, ctx: Optional[Context] = None
+    ) -> List[VersionResponse]:
+        """Get all versions available in a specific Jira project.
+
+        Useful for finding valid version names when setting fix_versions or target_version on issues.
+
+        Args:
+            project_key: Project key (e.g., 'ACM', 'PROJ')
+            ctx: MCP context for progress reporting
+        """
+        log = ctx or _NULL_CTX
+        info, error = log.info, log.error
+        await info(f"Fetching versions for project: {project_key}")
+
+        try:
+            versions = await self.client.get_project_versions(project_key)
+            await info(f"Found {len(versions)} versions in project {project_key}")
+            return [VersionResponse(**version) for version in versions]
+        except Exception as e:
+            await error(f"Failed to get versions for project {project_key}: {str(e)}")
+            raise
+
+    async def get_project_components(
+        self, project_key: str, ctx: Optional[Context] = None
+    ) -> List[ComponentResponse]:
+        """Get all components available in a specific Jira project.
+
+        Args:
+            project_key: Project key (e.g., 'ACM', 'PROJ')
+            ctx: MCP context for progress reporting
+        """
+        log = ctx or _NULL_CTX
+        info, error = log.info, log.error
+        await info(f"Fetching components for project: {project_key}")
+
+        try:
+            components = await self.client.get_project_components(project_key)
+            await info(f"Found {len(components)} components in project {project_key}")
+            return [ComponentResponse(**component) for component in components]
+        except Exception as e:
+            await error(f"Failed to get components for project {project_key}: {str(e)}")
+            raise
+
+    async def link_issue(
+        self,
+        link_type: str,
+        inward_issue: str,
+        outward_issue: str,
+        comment: Optional[str] = None,
+        security_level: Optional[str] = None,
+        ctx: Optional[Context] = None,
+    ) -> LinkResponse:
+        """Create a link between two Jira issues.
+
+        Args:
+            link_type: The type of link to create (e.g., 'Blocks', 'Relates', 'Duplicates')
+            inward_issue: The issue key to link from (e.g., 'PROJ-123')
+            outward_issue: The issue key to link to (e.g., 'PROJ-456')
+            comment: Optional comment to add when creating the link
+            security_level: Optional security level for the comment (default: None)
+            ctx: MCP context for progress reporting
+        """
+        log = ctx or _NULL_CTX
+        info, error = log.info, log.error
+        await info(f"Creating link: {inward_issue} {link_type} {outward_issue}")
+
+        try:
+            link_data = await self.client.create_issue_link(
+                link_type, inward_issue, outward_issue, comment, security_level
+            )
+            await info(
+                f"Successfully created link between {inward_issue} and {outward_issue}"
+            )
+            return LinkResponse(**link_data)
+        except Exception as e:
+            await error(f"Failed to create link: {str(e)}")
+            raise
+
+    async def get_link_types(
+        self,
+        ctx: Optional[Context] = None,
+    ) -> List[LinkTypeResponse]:
+        """Get all available issue link types.
+
+        Args:
+            ctx: MCP context for progress reporting
+        """
+        log = ctx or _NULL_CTX
+        info, error = log.info, log.error
+        await info("Fetching available link types")
+
+        try:
+            link_types = await self.client.get_issue_link_types()
+            await info(f"Found {len(link_types)} link types")
+            return [LinkTypeResponse(**link_type) for link_type in link_types]
+        except Exception as e:
+            await error(f"Failed to get link types: {str(e)}")
+            raise
+
+    async def debug_issue_fields(
+        self, issue_key: str, ctx: Optional[Context] = None
+    ) -> Dict[str, Any]:
+        """Debug function to show all raw Jira fields for an issue.
+
+        Args:
+            issue_key: Jira issue key (e.g., 'PROJ-123')
+            ctx: MCP context for progress reporting
+        """
+        log = ctx or _NULL_CTX
+        info, error = log.info, log.error
+        await info(f"Debugging raw fields for issue: {issue_key}")
+
+        try:
+            raw_issue = await self.client.get_raw_issue_fields(issue_key)
+            await info(f"Retrieved raw fields for issue: {issue_key}")
+            return raw_issue
+        except Exception as e:
+            await error(f"Failed to get raw fields for {issue_key}: {str(e)}")
+            raise
+
+    async def search_users(
+        self, query: str, max_results: int = 50, ctx: Optional[Context] = None
+    ) -> List[UserResponse]:
+        """Search for Jira users by name, email, or username.
+
+        This tool performs a fuzzy search across user names and email addresses,
+        making it useful for finding a user's Jira ID when you only have partial
+        information.
+
+        Args:
+            query: Search query - can be a partial name, email address, or username.
+                   Examples: "john", "jsmith", "john.smith@company.com"
+            max_results: Maximum number of results to return (default: 50)
+            ctx: MCP context for progress reporting
+
+        Returns:
+            List of matching users with their account_id, name, display_name,
+            email_address, and active status.  When using create_issue or
+            update_issue, the assignee parameter handles accountId resolution
+            automatically.
+        """
+        log = ctx or _NULL_CTX
+        info, error = log.info, log.error
+        await info(f"Searching for users matching: {query}")
+
+        try:
+            users = await self.client.search_users(query, max_results)
+            await info(f"Found {len(users)} matching users")
+            return [UserResponse(**user) for user in users]
+        except Exception as e:
+            await error(f"Failed to search users: {str(e)}")
+            raise
+
+    async def assign_team_to_issue(
+        self, issue_key: str, team_name: str, ctx: Optional[Context] = None
+    ) -> TeamAssignmentResponse:
+        """Assign a team to an issue by adding all team members as watchers.
+
+        Args:
+            issue_key: Jira issue key (e.g., 'PROJ-123')
+            team_name: Name of the team to assign
+            ctx: MCP context for progress reporting
+        """
+        log = ctx or _NULL_CTX
+        info, error = log.info, log.error
+        await info(f"Assigning team '{team_name}' to issue: {issue_key}")
+
+        try:
+            _validate_issue_key(issue_key)
+            team_members = self.config.get_team_members(team_name)
+            result = await self.client.add_team_as_watchers(issue_key, team_members)
+
+            await info(
+                f"Added {result['total_added']} watchers, {result['total_failed']} failed"
+            )
+
+            return TeamAssignmentResponse(
+                issue_key=result["issue_key"],
+                team_name=team_name,
+                successes=result["successes"],
+                failures=result["failures"],
+                total_added=result["total_added"],
+                total_failed=result["total_failed"],
+            )
+        except Exception as e:
+            await error(f"Failed to assign team to {issue_key}: {str(e)}")
+            raise
+
+    async def add_watcher_to_issue(
+        self, issue_key: str, username: str, ctx: Optional[Context] = None
+    ) -> Dict[str, Any]:
+        """Add a watcher to an issue.
+
+        Args:
+            issue_key: Jira issue key (e.g., 'PROJ-123')
+            username: Username of the user to add as watcher
+            ctx: MCP context for progress reporting
+        """
+        log = ctx or _NULL_CTX
+        info, error = log.info, log.error
+        await info(f"Adding watcher {username} to issue: {issue_key}")
+
+        try:
+            _validate_issue_key(issue_key)
+            result = await self.client.add_watcher(issue_key, username)
+            await info(f"Successfully added watcher {username}")
+            return result
+        except Exception as e:
+            await error(f"Failed to add watcher: {str(e)}")
+            raise
+
+    async def remove_watcher_from_issue(
+        self, issue_key: str, username: str, ctx: Optional[Context] = None
+    ) -> Dict[str, Any]:
+        """Remove a watcher from an issue.
+
+        Args:
+            issue_key: Jira issue key (e.g., 'PROJ-123')
+            username: Username of the user to remove as watcher
+            ctx: MCP context for progress reporting
+        """
+        log = ctx or _NULL_CTX
+        info, error = log.info, log.error
+        await info(f"Removing watcher {username} from issue: {issue_key}")
+
+        try:
+            _validate_issue_key(issue_key)
+            result = await self.client.remove_watcher(issue_key, username)
+            await info(f"Successfully removed watcher {username}")
+            return result
+        except Exception as e:
+            await error(f"Failed to remove watcher: {str(e)}")
+            raise
+
+    async def get_issue_watchers(
+        self, issue_key: str, ctx: Optional[Context] = None
+    ) -> List[WatcherResponse]:
+        """Get all watchers for an issue.
+
+        Args:
+            issue_key: Jira issue key (e.g., 'PROJ-123')
+            ctx: MCP context for progress reporting
+        """
+        log = ctx or _NULL_CTX
+        info, error = log.info, log.error
+        await info(f"Getting watchers for issue: {issue_key}")
+
+        try:
+            _validate_issue_key(issue_key)
+            watchers = await self.client.get_watchers(issue_key)
+            await info(f"Found {len(watchers)} watchers")
+            return _WATCHER_LIST_ADAPTER.validate_python(watchers)
+        except Exception as e:
+            await error(f"Failed to get watchers: {str(e)}")
+            raise
+
+    async def list_teams(self, ctx: Optional[Context] = None) -> TeamInfoResponse:
+        """List all configured teams and their members.
+
+        Args:
+            ctx: MCP context for progress reporting
+        """
+        log = ctx or _NULL_CTX
+        info, error = log.info, log.error
+        await info("Listing all teams")
+
+        try:
+            teams = self.config.list_teams()
+            await info(f"Found {len(teams)} teams")
+            return TeamInfoResponse(teams=teams)
+        except Exception as e:
+            await error(f"Failed to list teams: {str(e)}")
+            raise
+
+    async def add_team(
+        self, team_name: str, members: List[str], ctx: Optional[Context] = None
+    ) -> TeamInfoResponse:
+        """Add or update a team configuration.
+
+        Args:
+            team_name: Name of the team
+            members: List of member usernames
+            ctx: MCP context for progress reporting
+        """
+        log = ctx or _NULL_CTX
+        info, error = log.info, log.error
+        await info(f"Adding/updating team '{team_name}' with {len(members)} members")
+
+        try:
+            self.config.add_team(team_name, members)
+            await info(f"Successfully added/updated team '{team_name}'")
+            return TeamInfoResponse(teams=self.config.list_teams())
+        except Exception as e:
+            await error(f"Failed to add team: {str(e)}")
+            raise
+
+    async def remove_team(
+        self, team_name: str, ctx: Optional[Context] = None
+    ) -> TeamInfoResponse:
+        """Remove a team configuration.
+
+        Args:
+            team_name: Name of the team to remove
+            ctx: MCP context for progress reporting
+        """
+        log = ctx or _NULL_CTX
+        info, error = log.info, log.error
+        await info(f"Removing team '{team_name}'")
+
+        try:
+            self.config.remove_team(team_name)
+            await info(f"Successfully removed team '{team_name}'")
+            return TeamInfoResponse(teams=self.config.list_teams())
+        except Exception as e:
+            await error(f"Failed to remove team: {str(e)}")
+            raise
+
+    async def list_component_aliases(
+        self,
+        ctx: Optional[Context] = None,
+    ) -> ComponentAliasResponse:
+        """List all configured component aliases.
+
+        Args:
+            ctx: MCP context for progress reporting
+        """
+        log = ctx or _NULL_CTX
+        info, error = log.info, log.error
+        await info("Listing all component aliases")
+
+        try:
+            aliases = self.config.list_component_aliases()
+            await info(f"Found {len(aliases)} component aliases")
+            return ComponentAliasResponse(aliases=aliases)
+        except Exception as e:
+            await error(f"Failed to list component aliases: {str(e)}")
+            raise
+
+    async def add_component_alias(
+        self, alias: str, component_name: str, ctx: Optional[Context] = None
+    ) -> ComponentAliasResponse:
+        """Add or update a component alias configuration.
+
+        Args:
+            alias: Short alias for the component (e.g., 'ui', 'be', 'infra')
+            component_name: Actual component name in Jira (e.g., 'User Interface', 'Backend Services')
+            ctx: MCP context for progress reporting
+        """
+        log = ctx or _NULL_CTX
+        info, error = log.info, log.error
+        await info(f"Adding/updating component alias '{alias}' -> '{component_name}'")
+
+        try:
+            self.config.add_component_alias(alias, component_name)
+            await info(f"Successfully added/updated component alias '{alias}'")
+            return ComponentAliasResponse(aliases=self.config.list_component_aliases())
+        except Exception as e:
+            await error(f"Failed to add component alias: {str(e)}")
+            raise
+
+    async def remove_component_alias(
+        self, alias: str, ctx: Optional[Context] = None
+    ) -> ComponentAliasResponse:
+        """Remove a component alias configuration.
+
+        Args:
+            alias: Alias to remove
+            ctx: MCP context for progress reporting
+        """
+        log = ctx or _NULL_CTX
+        info, error = log.info, log.error
+        await info(f"Removing component alias '{alias}'")
+
+        try:
+            self.config.remove_component_alias(alias)
+            await info(f"Successfully removed component alias '{alias}'")
+            return ComponentAliasResponse(aliases=self.config.list_component_aliases())
+        except Exception as e:
+            await error(f"Failed to remove component alias: {str(e)}")
+            raise
+
+    def _setup_resources(self) -> None:
+        """Set up MCP resources for Jira data."""
+        for uri, name in self._RESOURCES:
+            self.mcp.resource(uri)(getattr(self, name))
+
+    async def get_issue_resource(self, issue_key: str) -> str:
+        """Get issue details as a formatted resource.
+
+        Args:
+            issue_key: Jira issue key (e.g., 'PROJ-123')
+        """
+        try:
+            _validate_issue_key(issue_key)
+            issue = await self.client.get_issue(issue_key)
+            return _format_issue_resource(issue)
+        except Exception as e:
+            return f"Error fetching issue {issue_key}: {str(e)}"
+
+    async def get_projects_resource(self) -> str:
+        """Get all projects as a formatted resource."""
+        try:
+            projects = await self.client.get_projects()
+            return _format_projects_resource(projects)
+        except Exception as e:
+            return f"Error fetching projects: {str(e)}"
+
+    async def _build_issue_fields(
+        self,
+        *,
+        summary: Optional[str] = None,
+        description: Optional[str] = None,
+        priority: Optional[str] = None,
+        assignee: Optional[str] = None,
+        labels: Optional[List[str]] = None,
+        fix_versions: Optional[List[str]] = None,
+        target_version: Optional[List[str]] = None,
+        work_type: Optional[str] = None,
+        security_level: Optional[str] = None,
+        due_date: Optional[str] = None,
+        target_start: Optional[str] = None,
+        target_end: Optional[str] = None,
+        components: Optional[List[str]] = None,
+        original_estimate: Optional[str] = None,
+        story_points: Optional[float] = None,
+        git_commit: Optional[str] = None,
+        git_pull_requests: Optional[str] = None,
+        parent: Optional[str] = None,
+        epic_name: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Build the Jira ``fields`` payload shared by create_issue and update_issue.
+
+        Only arguments that were provided are included. Component aliases are
+        resolved and the assignee is looked up to a Jira accountId.
+
+        Raises:
+            ValueError: If git_commit is not a valid SHA
+        """
+        # Taken before any other local is bound, so it holds just the arguments
+        arguments = locals()
+        if git_commit:
+            _validate_git_commit_sha(git_commit)
+
+        fields = _build_fields(arguments)
+        if components:
+            # Resolve component aliases to actual component names
+            fields["components"] = _name_refs(
+                self.config.resolve_component_names(components)
+            )
+        if story_points is not None:
+            fields["customfield_10028"] = story_points  # Story points custom field
+        if assignee:
+            fields["assignee"] = await self.client.resolve_assignee(assignee)
+
+        return fields
 
     async def _check_for_updates(self) -> None:
         """Check if origin/main has commits not present locally."""
@@ -1338,7 +1472,7 @@ class JiraMCPServer:
                     )
                     logger.warning(self._update_warning)
         except Exception as e:
-            logger.debug(f"Update check failed (non-fatal): {e}")
+            logger.debug("Update check failed (non-fatal): %s", e)
 
     async def _emit_update_warning(self, ctx: Optional[Context]) -> None:
         """Emit update warning once per session via MCP context."""
@@ -1352,12 +1486,35 @@ class JiraMCPServer:
             self.config.validate_required_fields()
             await self.client.connect()
             logger.info("Connected to Jira successfully")
-            logger.info(f"Server URL: {self.config.server_url}")
+            logger.info("Server URL: %s", self.config.server_url)
             await self._check_for_updates()
         except Exception as e:
-            logger.error(f"Failed to start server: {e}")
+            logger.error("Failed to start server: %s", e)
             raise
 
+    async def shutdown(self) -> None:
+        """Release the Jira client's pooled HTTP connections."""
+        await self.client.close()
+
+    @asynccontextmanager
+    async def _lifespan(self, mcp: FastMCP) -> AsyncIterator[Dict[str, Any]]:
+        """FastMCP lifespan that keeps the Jira connection warm while serving.
+
+        The keep-alive task runs on the server's own event loop; start() runs
+        on a separate one that has already finished by the time tools are
+        served. The client is reconnected if an earlier session closed it, and
+        shut down again when this one ends.
+        """
+        if not self.client.connected:
+            await self.client.connect()
+        keepalive = asyncio.create_task(self.client.keep_alive())
+        try:
+            yield {}
+        finally:
+            keepalive.cancel()
+            await asyncio.gather(keepalive, return_exceptions=True)
+            await self.shutdown()
+
     def create_sse_app(self, host: str = "127.0.0.1", port: int = 8000) -> Any:
         """Create SSE HTTP app for the MCP server.
 
@@ -1379,8 +1536,28 @@ class JiraMCPServer:
         """
         import uvicorn
 
+        # Prefer the libuv-backed event loop and the C HTTP parser when the
+        # optional 'sse' extra is installed; they are noticeably faster for
+        # the many small MCP frames.
+        loop = "uvloop" if importlib.util.find_spec("uvloop") else "asyncio"
+        http = "httptools" if importlib.util.find_spec("httptools") else "h11"
+
         app = self.create_sse_app(host, port)
-        logger.info(f"Starting SSE server on {host}:{port}")
-        logger.info(f"SSE endpoint: http://{host}:{port}/sse")
-        logger.info(f"Message endpoint: http://{host}:{port}/messages/")
-        uvicorn.run(app, host=host, port=port)
+        logger.info(
+            "Starting SSE server on %s:%s (event loop: %s, HTTP parser: %s)",
+            host,
+            port,
+            loop,
+            http,
+        )
+        logger.info("SSE endpoint: http://%s:%s/sse", host, port)
+        logger.info("Message endpoint: http://%s:%s/messages/", host, port)
+        uvicorn.run(
+            app,
+            host=host,
+            port=port,
+            loop=loop,
+            http=http,
+            # A log line per MCP message adds up; keep it for debugging only
+            access_log=logger.isEnabledFor(logging.DEBUG),
+        )
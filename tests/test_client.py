@@ -0,0 +1,498 @@
+# Copyright 2025 Red Hat, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for JiraClient request handling: issue search paging, the issue and
+watcher caches, adding team watchers, direct field updates and issue
+links, and connection keep-alive."""
+
+import asyncio
+import json
+import threading
+import time
+from types import SimpleNamespace
+from typing import Any, Dict, List, Set, Tuple
+from unittest.mock import AsyncMock
+
+import pytest
+from jira import JIRAError
+from jira.client import ResultList
+
+from jira_mcp_server import client as client_module
+from jira_mcp_server.client import ISSUE_FIELDS, JiraClient
+from jira_mcp_server.config import JiraConfig
+
+# ---------------------------------------------------------------------------
+# Reusable fakes
+# ---------------------------------------------------------------------------
+
+
+class FakeResponse:
+    """Minimal stand-in for a ``requests.Response``."""
+
+    def __init__(self, data: Any, status_code: int = 200):
+        self._data = data
+        self.status_code = status_code
+        self.text = json.dumps(data) if not isinstance(data, str) else data
+
+    @property
+    def ok(self) -> bool:
+        return 200 <= self.status_code < 300
+
+    def json(self) -> Any:
+        return self._data
+
+
+class FakeSession:
+    """Fake HTTP session that records requests and returns canned data."""
+
+    def __init__(self) -> None:
+        self.get_calls: List[str] = []
+        self.put_calls: List[Dict[str, Any]] = []
+        self.post_calls: List[Dict[str, Any]] = []
+        self._responses: Dict[str, FakeResponse] = {}
+
+    def register(self, url_substring: str, response: FakeResponse) -> None:
+        self._responses[url_substring] = response
+
+    def get(self, url: str) -> FakeResponse:
+        self.get_calls.append(url)
+        for substring, response in self._responses.items():
+            if substring in url:
+                return response
+        return FakeResponse({"errorMessages": ["no canned response"]}, 404)
+
+    def put(self, url: str, data: str) -> FakeResponse:
+        self.put_calls.append({"url": url, "data": json.loads(data)})
+        return FakeResponse("", 204)
+
+    def post(self, url: str, data: str) -> FakeResponse:
+        self.post_calls.append({"url": url, "data": json.loads(data)})
+        return FakeResponse("", 201)
+
+
+class FakeJira:
+    """In-memory stand-in for ``jira.JIRA``.
+
+    Supports the subset of the API used by ``JiraClient``: the ``_options``
+    dict, the ``_session`` for raw REST calls, ``issue`` creation and
+    lookups, link types, watchers, server info, and issue search over ``search_results``
+    (token-paged on Cloud, offset-paged on Server/Data Center).
+    """
+
+    def __init__(self, server_url: str = "https://redhat.atlassian.net"):
+        self._options: Dict[str, Any] = {"server": server_url}
+        self._is_cloud = server_url.endswith(".atlassian.net")
+        self._session = FakeSession()
+        self.search_results: List[Any] = []
+        self.search_calls: List[Dict[str, Any]] = []
+        self.page_size = 100
+        self.issue_calls: List[str] = []
+        self.link_type_calls = 0
+        self.watcher_calls: List[str] = []
+        self.added_watchers: List[Tuple[str, str]] = []
+        self.failing_watchers: Set[str] = set()
+        self.watcher_delay = 0.0
+        self.watchers_in_flight = 0
+        self.peak_watchers_in_flight = 0
+        self._lock = threading.Lock()
+        self.server_info_calls = 0
+
+    def issue(self, issue_key: str, **kwargs: Any) -> str:
+        self.issue_calls.append(issue_key)
+        return issue_key
+
+    def create_issue(self, fields: Dict[str, Any]) -> str:
+        return "ACM-100"
+
+    def server_info(self) -> Dict[str, Any]:
+        self.server_info_calls += 1
+        return {}
+
+    def watchers(self, issue_key: str) -> SimpleNamespace:
+        self.watcher_calls.append(issue_key)
+        watcher = SimpleNamespace(name="jdoe", displayName="John Doe")
+        return SimpleNamespace(watchers=[watcher])
+
+    def add_watcher(self, issue_key: str, username: str) -> None:
+        with self._lock:
+            self.watchers_in_flight += 1
+            self.peak_watchers_in_flight = max(
+                self.peak_watchers_in_flight, self.watchers_in_flight
+            )
+        time.sleep(self.watcher_delay)
+        with self._lock:
+            self.watchers_in_flight -= 1
+            self.added_watchers.append((issue_key, username))
+        if username in self.failing_watchers:
+            raise JIRAError(status_code=404, text="no such user")
+
+    def issue_link_types(self) -> List[SimpleNamespace]:
+        self.link_type_calls += 1
+        return [
+            SimpleNamespace(name="Blocks", inward="is blocked by", outward="blocks")
+        ]
+
+    def enhanced_search_issues(self, jql: str, **kwargs: Any) -> ResultList:
+        self.search_calls.append({"jql": jql, **kwargs})
+        start = int(kwargs.get("nextPageToken") or 0)
+        end = start + min(kwargs["maxResults"], self.page_size)
+        token = str(end) if end < len(self.search_results) else None
+        return ResultList(self.search_results[start:end], _nextPageToken=token)
+
+    def search_issues(self, jql: str, **kwargs: Any) -> ResultList:
+        self.search_calls.append({"jql": jql, **kwargs})
+        start = kwargs["startAt"]
+        end = start + min(kwargs["maxResults"], self.page_size)
+        return ResultList(
+            self.search_results[start:end],
+            _startAt=start,
+            _total=len(self.search_results),
+        )
+
+
+def _make_config() -> JiraConfig:
+    return JiraConfig(
+        server_url="https://redhat.atlassian.net",
+        access_token="fake-token",
+        email="bot@redhat.com",
+    )
+
+
+def _make_client(fake_jira: FakeJira | None = None) -> JiraClient:
+    config = _make_config()
+    client = JiraClient(config)
+    client._jira = fake_jira or FakeJira()
+    return client
+
+
+# ---------------------------------------------------------------------------
+# search_issues
+# ---------------------------------------------------------------------------
+
+
+class TestSearchIssues:
+    @pytest.mark.asyncio
+    async def test_requests_only_converted_fields(self):
+        fake = FakeJira()
+        client = _make_client(fake_jira=fake)
+
+        await client.search_issues("project = ACM", max_results=5)
+
+        (call,) = fake.search_calls
+        assert call["jql"] == "project = ACM"
+        assert call["maxResults"] == 5
+        assert call["fields"] == ISSUE_FIELDS
+        assert "expand" not in call
+
+    @pytest.mark.asyncio
+    async def test_follows_page_tokens_up_to_max_results(self):
+        fake = FakeJira()
+        fake.search_results = list(range(250))
+        client = _make_client(fake_jira=fake)
+        client._issue_to_dict = lambda issue: {"key": issue}
+
+        issues = await client.search_issues("project = ACM", max_results=220)
+
+        assert [issue["key"] for issue in issues] == list(range(220))
+        assert [call["maxResults"] for call in fake.search_calls] == [220, 120, 20]
+        assert [call["nextPageToken"] for call in fake.search_calls] == [
+            None,
+            "100",
+            "200",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_server_pages_by_offset(self):
+        fake = FakeJira(server_url="https://jira.example.com")
+        fake.search_results = list(range(250))
+        client = _make_client(fake_jira=fake)
+        client._issue_to_dict = lambda issue: {"key": issue}
+
+        issues = await client.search_issues("project = ACM", max_results=220)
+
+        assert [issue["key"] for issue in issues] == list(range(220))
+        assert [call["startAt"] for call in fake.search_calls] == [0, 100, 200]
+        assert [call["maxResults"] for call in fake.search_calls] == [220, 120, 20]
+        assert all(call["fields"] == ISSUE_FIELDS for call in fake.search_calls)
+
+    @pytest.mark.asyncio
+    async def test_server_stops_at_total(self):
+        fake = FakeJira(server_url="https://jira.example.com")
+        fake.search_results = list(range(100))
+        client = _make_client(fake_jira=fake)
+        client._issue_to_dict = lambda issue: {"key": issue}
+
+        issues = await client.search_issues("project = ACM", max_results=500)
+
+        assert len(issues) == 100
+        assert len(fake.search_calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_pages_yielded_as_they_arrive(self):
+        fake = FakeJira()
+        fake.search_results = list(range(150))
+        client = _make_client(fake_jira=fake)
+        client._issue_to_dict = lambda issue: {"key": issue}
+
+        sizes = []
+        async for page in client.search_issue_pages("project = ACM", 200):
+            sizes.append(len(page))
+            assert len(fake.search_calls) == len(sizes)
+
+        assert sizes == [100, 50]
+
+    @pytest.mark.asyncio
+    async def test_stops_when_results_run_out(self):
+        fake = FakeJira()
+        fake.search_results = list(range(30))
+        client = _make_client(fake_jira=fake)
+        client._issue_to_dict = lambda issue: {"key": issue}
+
+        issues = await client.search_issues("project = ACM", max_results=100)
+
+        assert len(issues) == 30
+        assert len(fake.search_calls) == 1
+
+
+# ---------------------------------------------------------------------------
+# get_issue
+# ---------------------------------------------------------------------------
+
+
+class TestGetIssueCache:
+    @pytest.fixture
+    def fake(self) -> FakeJira:
+        return FakeJira()
+
+    @pytest.fixture
+    def client(self, fake: FakeJira) -> JiraClient:
+        client = _make_client(fake_jira=fake)
+        client._issue_to_dict = lambda issue: {"key": issue}
+        return client
+
+    @pytest.mark.asyncio
+    async def test_repeated_reads_fetch_once(self, client, fake):
+        first = await client.get_issue("ACM-1")
+        second = await client.get_issue("ACM-1")
+
+        assert first == second == {"key": "ACM-1"}
+        assert fake.issue_calls == ["ACM-1"]
+
+    @pytest.mark.asyncio
+    async def test_expired_entry_is_refetched(self, client, fake):
+        client._issue_cache.ttl = 0.0
+
+        await client.get_issue("ACM-1")
+        await client.get_issue("ACM-1")
+
+        assert fake.issue_calls == ["ACM-1", "ACM-1"]
+
+    @pytest.mark.asyncio
+    async def test_update_refetches_issue(self, client, fake):
+        await client.get_issue("ACM-1")
+        await client.update_issue("ACM-1", summary="New")
+
+        assert fake.issue_calls == ["ACM-1", "ACM-1"]
+
+    @pytest.mark.asyncio
+    async def test_keys_match_case_insensitively(self, client, fake):
+        await client.get_issue("acm-1")
+        await client.get_issue("ACM-1")
+        await client.update_issue("acm-1", summary="New")
+        await client.get_issue("ACM-1")
+
+        assert fake.issue_calls == ["acm-1", "acm-1"]
+
+    @pytest.mark.asyncio
+    async def test_create_subtask_refetches_parent(self, client, fake):
+        await client.get_issue("ACM-1")
+        await client.create_issue("ACM", "Sub", "Desc", parent={"key": "ACM-1"})
+        await client.get_issue("ACM-1")
+
+        assert fake.issue_calls == ["ACM-1", "ACM-1"]
+
+    @pytest.mark.asyncio
+    async def test_least_recently_used_entry_evicted(self, client, fake):
+        client._issue_cache.maxsize = 2
+
+        for key in ("ACM-1", "ACM-2", "ACM-1", "ACM-3", "ACM-1", "ACM-2"):
+            await client.get_issue(key)
+
+        assert fake.issue_calls == ["ACM-1", "ACM-2", "ACM-3", "ACM-2"]
+
+
+# ---------------------------------------------------------------------------
+# get_watchers
+# ---------------------------------------------------------------------------
+
+
+class TestGetWatchersCache:
+    @pytest.mark.asyncio
+    async def test_repeated_reads_fetch_once(self):
+        fake = FakeJira()
+        client = _make_client(fake_jira=fake)
+
+        first = await client.get_watchers("ACM-1")
+        second = await client.get_watchers("ACM-1")
+
+        assert first == second
+        assert first[0]["username"] == "jdoe"
+        assert fake.watcher_calls == ["ACM-1"]
+
+    @pytest.mark.asyncio
+    async def test_add_watcher_refetches_watchers(self):
+        fake = FakeJira()
+        client = _make_client(fake_jira=fake)
+
+        await client.get_watchers("ACM-1")
+        await client.add_watcher("ACM-1", "asmith")
+        await client.get_watchers("ACM-1")
+
+        assert fake.watcher_calls == ["ACM-1", "ACM-1"]
+
+
+# ---------------------------------------------------------------------------
+# add_team_as_watchers
+# ---------------------------------------------------------------------------
+
+
+class TestAddTeamAsWatchers:
+    @pytest.mark.asyncio
+    async def test_adds_each_member_by_issue_key(self):
+        """Each watcher is one add_watcher call, without fetching the issue."""
+        fake = FakeJira()
+        client = _make_client(fake_jira=fake)
+
+        result = await client.add_team_as_watchers("PROJ-1", ["alice", "bob"])
+
+        assert sorted(fake.added_watchers) == [("PROJ-1", "alice"), ("PROJ-1", "bob")]
+        assert fake.issue_calls == []
+        assert result["total_added"] == 2
+
+    @pytest.mark.asyncio
+    async def test_adds_concurrently_and_reports_failures(self, monkeypatch):
+        """Watchers are added in parallel, bounded, with failures collected."""
+        monkeypatch.setattr(client_module, "WATCHER_CONCURRENCY", 2)
+        fake = FakeJira()
+        fake.failing_watchers = {"bob"}
+        fake.watcher_delay = 0.05
+        client = _make_client(fake_jira=fake)
+
+        result = await client.add_team_as_watchers(
+            "PROJ-1", ["alice", "bob", "carol", "dave"]
+        )
+
+        assert fake.peak_watchers_in_flight == 2
+        assert result["successes"] == ["alice", "carol", "dave"]
+        [failure] = result["failures"]
+        assert failure["username"] == "bob"
+        assert "no such user" in failure["error"]
+        assert result["total_added"] == 3
+        assert result["total_failed"] == 1
+
+
+# ---------------------------------------------------------------------------
+# keep_alive
+# ---------------------------------------------------------------------------
+
+
+class TestKeepAlive:
+    @pytest.mark.asyncio
+    async def test_pings_only_while_idle(self, monkeypatch):
+        monkeypatch.setattr(client_module, "KEEPALIVE_INTERVAL", 0.1)
+        fake = FakeJira()
+        client = _make_client(fake_jira=fake)
+
+        task = asyncio.create_task(client.keep_alive())
+        await asyncio.sleep(0.05)
+        assert fake.server_info_calls == 0
+
+        await asyncio.sleep(0.1)
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+        assert fake.server_info_calls == 1
+
+
+# ---------------------------------------------------------------------------
+# update_issue
+# ---------------------------------------------------------------------------
+
+
+class TestUpdateIssue:
+    @pytest.mark.asyncio
+    async def test_puts_fields_then_fetches_issue_once(self):
+        fake = FakeJira()
+        client = _make_client(fake_jira=fake)
+        client.get_issue = AsyncMock(return_value={"key": "ACM-1"})
+
+        result = await client.update_issue(
+            "ACM-1", summary="New", timetracking={"originalEstimate": "2h"}
+        )
+
+        assert result == {"key": "ACM-1"}
+        assert fake._session.put_calls == [
+            {
+                "url": "https://redhat.atlassian.net/rest/api/2/issue/ACM-1",
+                "data": {
+                    "fields": {
+                        "summary": "New",
+                        "timetracking": {"originalEstimate": "120"},
+                    }
+                },
+            }
+        ]
+        client.get_issue.assert_awaited_once_with("ACM-1")
+
+
+# ---------------------------------------------------------------------------
+# create_issue_link
+# ---------------------------------------------------------------------------
+
+
+class TestCreateIssueLink:
+    @pytest.mark.asyncio
+    async def test_link_and_comment_sent_in_one_request(self):
+        fake = FakeJira()
+        client = _make_client(fake_jira=fake)
+
+        result = await client.create_issue_link(
+            "blocks", "ACM-1", "ACM-2", comment="See ACM-2"
+        )
+
+        assert fake.link_type_calls == 1
+        assert fake._session.post_calls == [
+            {
+                "url": "https://redhat.atlassian.net/rest/api/2/issueLink",
+                "data": {
+                    "type": {"name": "Blocks"},
+                    "inwardIssue": {"key": "ACM-1"},
+                    "outwardIssue": {"key": "ACM-2"},
+                    "comment": {"body": "See ACM-2"},
+                },
+            }
+        ]
+        assert result["inward_description"] == "is blocked by"
+
+    @pytest.mark.asyncio
+    async def test_inward_phrase_swaps_issues(self):
+        fake = FakeJira()
+        client = _make_client(fake_jira=fake)
+
+        await client.create_issue_link("is blocked by", "ACM-1", "ACM-2")
+
+        (call,) = fake._session.post_calls
+        assert call["data"]["type"] == {"name": "Blocks"}
+        assert call["data"]["inwardIssue"] == {"key": "ACM-2"}
+        assert call["data"]["outwardIssue"] == {"key": "ACM-1"}
@@ -16,6 +16,7 @@
 
 import json
 import os
+from unittest.mock import patch
 
 import pytest
 
@@ -32,9 +33,8 @@ class TestComponentAliasConfiguration:
             "be": "Backend Services",
             "infra": "Infrastructure",
         }
-        os.environ["JIRA_COMPONENT_ALIASES"] = json.dumps(aliases)
-
-        config = JiraConfig.from_env()
+        with patch.dict(os.environ, {"JIRA_COMPONENT_ALIASES": json.dumps(aliases)}):
+            config = JiraConfig.from_env()
 
         assert "ui" in config.component_aliases
         assert "be" in config.component_aliases
@@ -45,21 +45,29 @@ class TestComponentAliasConfiguration:
 
     def test_empty_component_aliases_env(self):
         """Test with empty or missing JIRA_COMPONENT_ALIASES environment variable."""
-        os.environ["JIRA_COMPONENT_ALIASES"] = ""
-
-        config = JiraConfig.from_env()
+        with patch.dict(os.environ, {"JIRA_COMPONENT_ALIASES": ""}):
+            config = JiraConfig.from_env()
 
         assert config.component_aliases == {}
 
     def test_invalid_component_aliases_json(self):
         """Test with invalid JSON in JIRA_COMPONENT_ALIASES."""
-        os.environ["JIRA_COMPONENT_ALIASES"] = "invalid json"
-
-        config = JiraConfig.from_env()
+        with patch.dict(os.environ, {"JIRA_COMPONENT_ALIASES": "invalid json"}):
+            config = JiraConfig.from_env()
 
         # Should default to empty dict on invalid JSON
         assert config.component_aliases == {}
 
+    def test_configs_from_same_env_are_independent(self):
+        """Test that configs sharing a parsed env value don't share state."""
+        aliases = {"ui": "User Interface"}
+        with patch.dict(os.environ, {"JIRA_COMPONENT_ALIASES": json.dumps(aliases)}):
+            first = JiraConfig.from_env()
+            second = JiraConfig.from_env()
+        first.add_component_alias("be", "Backend Services")
+
+        assert second.component_aliases == {"ui": "User Interface"}
+
     def test_get_component_name_with_alias(self):
         """Test getting component name from an alias."""
         config = JiraConfig(
@@ -109,6 +117,37 @@ class TestComponentAliasConfiguration:
 
         assert resolved == []
 
+    def test_resolve_component_names_tracks_alias_changes(self):
+        """Test resolutions follow every change to the aliases."""
+        config = JiraConfig(
+            server_url="https://test.atlassian.net",
+            access_token="test-token",
+            component_aliases={"ui": "User Interface"},
+        )
+
+        resolved = config.resolve_component_names(["ui", "be"])
+        assert resolved == ["User Interface", "be"]
+        resolved.append("mutated")
+        assert config.resolve_component_names(["ui", "be"]) == ["User Interface", "be"]
+
+        config.add_component_alias("be", "Backend Services")
+        assert config.resolve_component_names(["ui", "be"]) == [
+            "User Interface",
+            "Backend Services",
+        ]
+
+        config.remove_component_alias("ui")
+        assert config.resolve_component_names(["ui", "be"]) == [
+            "ui",
+            "Backend Services",
+        ]
+
+        config.component_aliases = {"ui": "UI"}
+        assert config.resolve_component_names(["ui", "be"]) == ["UI", "be"]
+
+        config.component_aliases["be"] = "BE"
+        assert config.resolve_component_names(["ui", "be"]) == ["UI", "BE"]
+
     def test_add_component_alias(self):
         """Test adding a new component alias."""
         config = JiraConfig(
@@ -19,8 +19,15 @@ from unittest.mock import AsyncMock
 
 import pytest
 from fastmcp import Client
+from fastmcp.utilities.types import get_cached_typeadapter
+from pydantic import ValidationError
 
-from jira_mcp_server.server import JiraMCPServer, _validate_git_commit_sha
+from jira_mcp_server.server import (
+    IssueResponse,
+    JiraMCPServer,
+    _validate_git_commit_sha,
+    _validate_issue_key,
+)
 
 # ─── Fixtures ───────────────────────────────────────────────────────────────
 
@@ -99,6 +106,10 @@ class TestValidateGitCommitSha:
         with pytest.raises(ValueError, match="hexadecimal"):
             _validate_git_commit_sha("z" * 40)
 
+    def test_embedded_whitespace_raises(self):
+        with pytest.raises(ValueError, match="hexadecimal"):
+            _validate_git_commit_sha("ab " * 13 + "a")
+
 
 # ─── create_issue ────────────────────────────────────────────────────────────
 
@@ -135,6 +146,22 @@ class TestCreateIssue:
                     },
                 )
 
+    @pytest.mark.asyncio
+    async def test_blank_assignee_raises(self, server):
+        async with Client(server.mcp) as client:
+            with pytest.raises(Exception, match="Assignee cannot be empty"):
+                await client.call_tool(
+                    "create_issue",
+                    {
+                        "project_key": "TEST",
+                        "summary": "Valid summary",
+                        "description": "desc",
+                        "assignee": "  ",
+                    },
+                )
+
+        server.client.create_issue.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_calls_client_on_valid_input(self, server):
         server.client.create_issue = AsyncMock(return_value=FAKE_ISSUE)
@@ -152,6 +179,38 @@ class TestCreateIssue:
 
         server.client.create_issue.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_team_watcher_progress_and_failures_logged(self, server):
+        server.config.teams = {"core": ["alice", "bob"]}
+        server.client.create_issue = AsyncMock(return_value=FAKE_ISSUE)
+        server.client.add_team_as_watchers = AsyncMock(
+            return_value={"failures": [{"username": "bob", "error": "no such user"}]}
+        )
+        logs = []
+
+        async def log_handler(message):
+            logs.append((message.level, message.data["msg"]))
+
+        async with Client(server.mcp, log_handler=log_handler) as client:
+            await client.call_tool(
+                "create_issue",
+                {
+                    "project_key": "TEST",
+                    "summary": "Fix it",
+                    "description": "desc",
+                    "team": "core",
+                },
+            )
+
+        server.client.add_team_as_watchers.assert_awaited_once_with(
+            "TEST-1", ["alice", "bob"]
+        )
+        assert logs == [
+            ("info", "Creating issue in project TEST"),
+            ("info", "Created issue: TEST-1\nAdding 2 team members as watchers"),
+            ("warning", "Failed to add team watchers: bob (no such user)"),
+        ]
+
     @pytest.mark.asyncio
     async def test_invalid_git_sha_raises(self, server):
         async with Client(server.mcp) as client:
@@ -191,6 +250,36 @@ class TestUpdateIssue:
         call_kwargs = server.client.update_issue.call_args
         assert call_kwargs[0][0] == "TEST-1"
 
+    @pytest.mark.asyncio
+    async def test_unknown_field_argument_raises(self, server):
+        with pytest.raises(TypeError):
+            await server._build_issue_fields(sumary="Typo")
+
+    @pytest.mark.asyncio
+    async def test_builds_jira_field_payload(self, server):
+        server.config.component_aliases = {"ui": "User Interface"}
+        server.client.update_issue = AsyncMock(return_value=FAKE_ISSUE)
+
+        async with Client(server.mcp) as client:
+            await client.call_tool(
+                "update_issue",
+                {
+                    "issue_key": "TEST-1",
+                    "priority": "Major",
+                    "components": ["ui", "Backend"],
+                    "fix_versions": ["1.0"],
+                    "story_points": 0,
+                },
+            )
+
+        fields = server.client.update_issue.call_args.kwargs
+        assert fields == {
+            "priority": {"name": "Major"},
+            "components": [{"name": "User Interface"}, {"name": "Backend"}],
+            "fixVersions": [{"name": "1.0"}],
+            "customfield_10028": 0,
+        }
+
 
 # ─── search_issues_by_team ───────────────────────────────────────────────────
 
@@ -205,8 +294,35 @@ class TestSearchIssuesByTeam:
             await client.call_tool("search_issues_by_team", {"team_name": "eng"})
 
         jql = server.client.search_issues.call_args[0][0]
-        assert 'assignee = "alice"' in jql
-        assert 'assignee = "bob"' in jql
+        assert jql == 'assignee in ("alice", "bob")'
+
+    @pytest.mark.asyncio
+    async def test_escapes_quotes_in_member_names(self, server):
+        server.config.teams = {"eng": ['o"brien']}
+        server.client.search_issues = AsyncMock(return_value=[])
+
+        async with Client(server.mcp) as client:
+            await client.call_tool("search_issues_by_team", {"team_name": "eng"})
+
+        jql = server.client.search_issues.call_args[0][0]
+        assert jql == 'assignee in ("o\\"brien")'
+
+    @pytest.mark.asyncio
+    async def test_jql_follows_team_changes(self, server):
+        server.config.teams = {"eng": ["alice"]}
+        server.client.search_issues = AsyncMock(return_value=[])
+        args = {"team_name": "eng", "project_key": "ACM", "status": "New"}
+
+        async with Client(server.mcp) as client:
+            await client.call_tool("search_issues_by_team", args)
+            server.config.add_team("eng", ["alice", "bob"])
+            await client.call_tool("search_issues_by_team", args)
+
+        jqls = [call[0][0] for call in server.client.search_issues.call_args_list]
+        assert jqls == [
+            'project = ACM AND assignee in ("alice") AND status = "New"',
+            'project = ACM AND assignee in ("alice", "bob") AND status = "New"',
+        ]
 
     @pytest.mark.asyncio
     async def test_adds_project_filter_when_provided(self, server):
@@ -284,6 +400,15 @@ class TestTransitionIssue:
 
 
 class TestGetIssue:
+    def test_issue_model_is_built_at_import(self):
+        # No forward references left to resolve on the first request
+        assert IssueResponse.__pydantic_complete__
+
+    def test_issue_model_is_frozen(self):
+        issue = IssueResponse(**FAKE_ISSUE)
+        with pytest.raises(ValidationError):
+            issue.summary = "changed"
+
     @pytest.mark.asyncio
     async def test_returns_issue_from_client(self, server):
         server.client.get_issue = AsyncMock(return_value=FAKE_ISSUE)
@@ -293,3 +418,238 @@ class TestGetIssue:
 
         server.client.get_issue.assert_called_once_with("TEST-1")
         assert result is not None
+
+    @pytest.mark.asyncio
+    async def test_nested_fields_are_serialized(self, server):
+        issue = {
+            **FAKE_ISSUE,
+            "story_points": 3,
+            "subtasks": [
+                {
+                    "key": "TEST-2",
+                    "summary": "Sub",
+                    "status": "New",
+                    "issue_type": "Sub-task",
+                }
+            ],
+            "parent": {"key": "TEST-0", "summary": "Epic", "issue_type": "Epic"},
+        }
+        server.client.get_issue = AsyncMock(return_value=issue)
+
+        async with Client(server.mcp) as client:
+            result = await client.call_tool("get_issue", {"issue_key": "TEST-1"})
+
+        data = result.structured_content["result"]
+        assert data["subtasks"] == issue["subtasks"]
+        assert data["parent"] == issue["parent"]
+        assert data["story_points"] == 3
+
+    @pytest.mark.asyncio
+    async def test_raw_returns_plain_dict(self, server):
+        server.client.get_issue = AsyncMock(return_value=FAKE_ISSUE)
+
+        async with Client(server.mcp) as client:
+            result = await client.call_tool(
+                "get_issue", {"issue_key": "TEST-1", "raw": True}
+            )
+
+        assert result.structured_content["result"]["key"] == "TEST-1"
+
+
+# ─── search_issues ───────────────────────────────────────────────────────────
+
+
+class TestSearchIssues:
+    @pytest.mark.asyncio
+    async def test_raw_returns_plain_dicts(self, server):
+        server.client.search_issues = AsyncMock(return_value=[FAKE_ISSUE])
+
+        async with Client(server.mcp) as client:
+            result = await client.call_tool(
+                "search_issues", {"jql": "project = TEST", "raw": True}
+            )
+
+        server.client.search_issues.assert_called_once_with("project = TEST", 100)
+        assert result.structured_content["result"][0]["key"] == "TEST-1"
+
+    @pytest.mark.asyncio
+    async def test_rejects_max_results_below_one(self, server):
+        server.client.search_issues = AsyncMock(return_value=[])
+
+        async with Client(server.mcp) as client:
+            with pytest.raises(Exception, match="max_results must be at least 1"):
+                await client.call_tool(
+                    "search_issues", {"jql": "project = TEST", "max_results": 0}
+                )
+
+        server.client.search_issues.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_large_result_set_is_fully_returned(self, server):
+        issues = [{**FAKE_ISSUE, "key": f"TEST-{i}"} for i in range(60)]
+        server.client.search_issues = AsyncMock(return_value=issues)
+
+        async with Client(server.mcp) as client:
+            result = await client.call_tool("search_issues", {"jql": "project = TEST"})
+
+        keys = [issue["key"] for issue in result.structured_content["result"]]
+        assert keys == [f"TEST-{i}" for i in range(60)]
+
+    @pytest.mark.asyncio
+    async def test_comments_are_returned(self, server):
+        comment = {
+            "id": "10001",
+            "body": "Looks good",
+            "author": "Alice",
+            "created": "2026-01-02T00:00:00.000+0000",
+            "updated": "2026-01-02T00:00:00.000+0000",
+        }
+        server.client.search_issues = AsyncMock(
+            return_value=[{**FAKE_ISSUE, "comments": [comment]}]
+        )
+
+        async with Client(server.mcp) as client:
+            result = await client.call_tool("search_issues", {"jql": "project = TEST"})
+
+        assert result.structured_content["result"][0]["comments"] == [comment]
+
+
+# ─── _validate_issue_key ─────────────────────────────────────────────────────
+
+
+class TestValidateIssueKey:
+    def test_project_key(self):
+        _validate_issue_key("ACM-12345")
+
+    def test_lowercase_key(self):
+        _validate_issue_key("acm_ui-7")
+
+    def test_numeric_id(self):
+        _validate_issue_key("10001")
+
+    def test_missing_number_raises(self):
+        with pytest.raises(ValueError, match="Invalid issue key"):
+            _validate_issue_key("ACM-")
+
+    def test_embedded_whitespace_raises(self):
+        with pytest.raises(ValueError, match="Invalid issue key"):
+            _validate_issue_key("ACM-1 OR 1=1")
+
+
+# ─── get_issue_watchers ──────────────────────────────────────────────────────
+
+
+class TestGetIssueWatchers:
+    @pytest.mark.asyncio
+    async def test_returns_watchers_without_extra_keys(self, server):
+        server.client.get_watchers = AsyncMock(
+            return_value=[
+                {
+                    "username": "jdoe",
+                    "display_name": "John Doe",
+                    "email": None,
+                    "active": True,
+                    "timezone": "UTC",
+                }
+            ]
+        )
+
+        async with Client(server.mcp) as client:
+            result = await client.call_tool(
+                "get_issue_watchers", {"issue_key": "TEST-1"}
+            )
+
+        assert result.structured_content == {
+            "result": [
+                {
+                    "username": "jdoe",
+                    "display_name": "John Doe",
+                    "email": None,
+                    "active": True,
+                }
+            ]
+        }
+
+    @pytest.mark.asyncio
+    async def test_malformed_key_skips_jira(self, server):
+        with pytest.raises(ValueError, match="Invalid issue key"):
+            await server.get_issue_watchers("not a key")
+
+        server.client.get_watchers.assert_not_called()
+
+
+# ─── resources ───────────────────────────────────────────────────────────────
+
+
+class TestResources:
+    @pytest.mark.asyncio
+    async def test_projects_resource(self, server):
+        server.client.get_projects = AsyncMock(
+            return_value=[
+                {"key": "A", "name": "Alpha", "description": "First", "lead": "Ann"},
+                {"key": "B", "name": "Beta", "description": "", "lead": "Ben"},
+            ]
+        )
+
+        async with Client(server.mcp) as client:
+            result = await client.read_resource("jira://projects")
+
+        assert result[0].text == (
+            "# Jira Projects\n\n"
+            "## A: Alpha\nFirst\n**Lead:** Ann\n\n"
+            "## B: Beta\n**Lead:** Ben\n\n"
+        )
+
+    @pytest.mark.asyncio
+    async def test_issue_resource(self, server):
+        server.client.get_issue = AsyncMock(
+            return_value={**FAKE_ISSUE, "labels": ["ui", "bug"], "story_points": 3}
+        )
+
+        async with Client(server.mcp) as client:
+            result = await client.read_resource("jira://issue/TEST-1")
+
+        text = result[0].text
+        assert text.startswith("# TEST-1: Fix it\n\n**Status:** ")
+        assert "- **Labels:** ui, bug\n- **Components:** None\n" in text
+        assert "- **Story Points:** 3\n" in text
+        assert text.endswith(f"\n**URL:** {FAKE_ISSUE['url']}\n")
+
+
+# ─── lifecycle ───────────────────────────────────────────────────────────────
+
+
+class TestLifecycle:
+    @pytest.mark.asyncio
+    async def test_client_closed_when_server_stops(self, server):
+        async with Client(server.mcp):
+            server.client.close.assert_not_called()
+
+        server.client.close.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_client_reconnected_for_next_session(self, server):
+        async def connect():
+            server.client.connected = True
+
+        async def close():
+            server.client.connected = False
+
+        server.client.connected = True
+        server.client.connect.side_effect = connect
+        server.client.close.side_effect = close
+
+        async with Client(server.mcp):
+            server.client.connect.assert_not_called()
+        async with Client(server.mcp):
+            assert server.client.connected
+
+        server.client.connect.assert_awaited_once()
+        assert server.client.close.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_result_adapters_built_at_startup(self, server):
+        for tool in await server.mcp.list_tools():
+            misses = get_cached_typeadapter.cache_info().misses
+            get_cached_typeadapter(tool.return_type)
+            assert get_cached_typeadapter.cache_info().misses == misses, tool.name
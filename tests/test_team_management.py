@@ -16,6 +16,7 @@
 
 import json
 import os
+from unittest.mock import patch
 
 import pytest
 
@@ -28,9 +29,8 @@ class TestTeamConfiguration:
     def test_teams_from_env(self):
         """Test loading teams from environment variable."""
         teams = {"frontend": ["alice", "bob"], "backend": ["charlie", "david"]}
-        os.environ["JIRA_TEAMS"] = json.dumps(teams)
-
-        config = JiraConfig.from_env()
+        with patch.dict(os.environ, {"JIRA_TEAMS": json.dumps(teams)}):
+            config = JiraConfig.from_env()
 
         assert "frontend" in config.teams
         assert "backend" in config.teams
@@ -39,17 +39,15 @@ class TestTeamConfiguration:
 
     def test_empty_teams_env(self):
         """Test with empty or missing JIRA_TEAMS environment variable."""
-        os.environ["JIRA_TEAMS"] = ""
-
-        config = JiraConfig.from_env()
+        with patch.dict(os.environ, {"JIRA_TEAMS": ""}):
+            config = JiraConfig.from_env()
 
         assert config.teams == {}
 
     def test_invalid_teams_json(self):
         """Test with invalid JSON in JIRA_TEAMS."""
-        os.environ["JIRA_TEAMS"] = "invalid json"
-
-        config = JiraConfig.from_env()
+        with patch.dict(os.environ, {"JIRA_TEAMS": "invalid json"}):
+            config = JiraConfig.from_env()
 
         # Should default to empty dict on invalid JSON
         assert config.teams == {}